@@ -12,12 +12,31 @@ The authentication manager handles token storage, session management,
 and automatic fallback between different registration methods.
 """
 
-import requests
-import json
-import sqlite3
+from __future__ import annotations
+
+import orjson
 import os
-from typing import Optional, Dict, Any
-from pathlib import Path
+import time
+import logging
+import base64
+import re
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Set, ClassVar
+
+# requests and sqlite3 are imported where they are first used so that
+# importing this module (e.g. for CLI --help) doesn't pay for them
+if TYPE_CHECKING:
+    import sqlite3
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Competition bot keys are single printable-ASCII tokens without inner
+# whitespace (surrounding whitespace is stripped first)
+_BOT_KEY_RE = re.compile(r"[\x21-\x7e]+")
 
 
 class AuthenticationManager:
@@ -31,6 +50,36 @@ class AuthenticationManager:
     - Error handling and fallback authentication methods
     """
     
+    # Fixed attribute layout keeps per-instance memory small when a fleet of
+    # bots each holds its own manager
+    __slots__ = (
+        "base_url", "_me_url", "session", "tokens_db_path", "current_token", "current_username",
+        "_auth_headers", "_conn", "_db_lock", "_token_cache", "_pending_tokens"
+    )
+    
+    # Token table statements, kept constant so sqlite3's statement cache
+    # reuses the prepared plan on every call
+    _SQL_CREATE = """
+        CREATE TABLE IF NOT EXISTS tokens (
+            username TEXT PRIMARY KEY,
+            token TEXT NOT NULL,
+            user_info TEXT
+        )
+    """
+    _SQL_GET = "SELECT token FROM tokens WHERE username = ?"
+    _SQL_PUT = "INSERT OR REPLACE INTO tokens (username, token, user_info) VALUES (?, ?, ?)"
+    _SQL_DEL = "DELETE FROM tokens WHERE username = ?"
+    
+    # Token databases whose directory and schema are already set up
+    _initialized_dbs: ClassVar[Set[str]] = set()
+    
+    # Seconds of remaining JWT lifetime required to skip the auth/me probe
+    JWT_EXPIRY_SKEW = 60
+    
+    # Retries for rate-limited (429) or unavailable (503) auth requests
+    MAX_AUTH_RETRIES = 3
+    MAX_RETRY_DELAY = 30
+    
     def __init__(self, base_url: str, tokens_db_path: str = "./tokens.db"):
         """
         Initialize the authentication manager.
@@ -40,14 +89,94 @@ class AuthenticationManager:
             tokens_db_path (str): Path to the SQLite database for storing authentication tokens
         """
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self._me_url = f"{self.base_url}/auth/me"
+        self.session = self._create_session()
         self.tokens_db_path = tokens_db_path
         self.current_token = None
         self.current_username = None
+        self._auth_headers: Dict[str, str] = {"Content-Type": "application/json"}
+        
+        # Single long-lived connection shared by all token helpers
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.RLock()
+        
+        # In-memory copy of tokens read from or written to the database
+        self._token_cache: Dict[str, str] = {}
+        
+        # When set, _store_token queues rows here instead of writing them
+        self._pending_tokens: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
         
         # Initialize token database
         self._init_token_db()
     
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create the HTTP session shared by authentication and posting calls.
+        
+        The session keeps a pool of keep-alive connections so login, token
+        validation and subsequent API calls reuse the same TCP/TLS connection
+        instead of handshaking again for every request. Failed connection
+        attempts are retried with backoff at the transport level.
+        
+        Returns:
+            requests.Session: Configured session with pooled connections
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update({"Content-Type": "application/json"})
+        
+        retries = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return the shared token database connection, opening it on first use.
+        
+        The connection runs in autocommit mode with WAL journaling so each
+        single-row token operation avoids reopening the file and forcing an
+        fsync on every commit.
+        
+        Returns:
+            sqlite3.Connection: The open token database connection
+        """
+        if self._conn is None:
+            import sqlite3
+            
+            self._conn = sqlite3.connect(
+                self.tokens_db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=128
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+        return self._conn
+    
+    def close(self):
+        """
+        Close the token database connection.
+        
+        The connection is reopened automatically if the manager is used again.
+        """
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _init_token_db(self):
         """
         Initialize the SQLite database for storing authentication tokens.
@@ -57,19 +186,36 @@ class AuthenticationManager:
         - token: The authentication token
         - user_info: JSON string containing user profile information
         """
+        # Directory and schema only need to be set up once per database file,
+        # however many managers (one per bot) share it
+        if self.tokens_db_path in AuthenticationManager._initialized_dbs:
+            return
+        
         # Ensure the database directory exists
-        db_path = Path(self.tokens_db_path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with sqlite3.connect(self.tokens_db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tokens (
-                    username TEXT PRIMARY KEY,
-                    token TEXT NOT NULL,
-                    user_info TEXT
-                )
-            """)
-            conn.commit()
+        os.makedirs(os.path.dirname(self.tokens_db_path) or ".", exist_ok=True)
+        
+        with self._db_lock:
+            self._connect().execute(self._SQL_CREATE)
+        AuthenticationManager._initialized_dbs.add(self.tokens_db_path)
+    
+    def _set_token(self, token: Optional[str], username: Optional[str]):
+        """
+        Set the current token and rebuild the cached authentication headers.
+        
+        Args:
+            token (Optional[str]): The authentication token, or None to clear it
+            username (Optional[str]): The username associated with the token
+        """
+        self.current_token = token
+        self.current_username = username
+        
+        headers = {"Content-Type": "application/json"}
+        
+        # Add authorization header for token-based auth
+        if token and token != "session_based":
+            headers["Authorization"] = f"Bearer {token}"
+        
+        self._auth_headers = headers
     
     def _store_token(self, username: str, token: str, user_info: Dict[str, Any]):
         """
@@ -80,33 +226,106 @@ class AuthenticationManager:
             token (str): The authentication token
             user_info (dict): User profile information returned from the API
         """
-        print(f"💾 Storing token for {username}, {token}...")
-        with sqlite3.connect(self.tokens_db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO tokens (username, token, user_info)
-                VALUES (?, ?, ?)
-            """, (username, token, json.dumps(user_info)))
-            conn.commit()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("💾 Storing token for %s, %s...", username, token)
+        self._token_cache[username] = token
+        if self._pending_tokens is not None:
+            self._pending_tokens.append((username, token, user_info))
+            return
+        
+        with self._db_lock:
+            self._connect().execute(self._SQL_PUT, (username, token, orjson.dumps(user_info).decode()))
+    
+    def _store_tokens_bulk(self, triples: List[Tuple[str, str, Dict[str, Any]]]):
+        """
+        Store several tokens in a single transaction.
+        
+        Args:
+            triples (List[Tuple[str, str, dict]]): (username, token, user_info) rows
+        """
+        if not triples:
+            return
+        
+        rows = [(username, token, orjson.dumps(user_info).decode())
+                for username, token, user_info in triples]
+        
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(self._SQL_PUT, rows)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        
+        for username, token, _ in triples:
+            self._token_cache[username] = token
     
     def _get_stored_token(self, username: str) -> Optional[str]:
         """
         Retrieve stored authentication token for a username.
         
+        Tokens are served from the in-memory cache when available and only
+        read from the database on a miss.
+        
         Args:
             username (str): The username to lookup
             
         Returns:
             Optional[str]: The stored token if found, None otherwise
         """
-        with sqlite3.connect(self.tokens_db_path) as conn:
-            cursor = conn.execute("SELECT token FROM tokens WHERE username = ?", (username,))
+        token = self._token_cache.get(username)
+        if token is not None:
+            return token
+        
+        with self._db_lock:
+            cursor = self._connect().execute(self._SQL_GET, (username,))
             result = cursor.fetchone()
-            return result[0] if result else None
+        
+        if result:
+            self._token_cache[username] = result[0]
+            return result[0]
+        return None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _jwt_exp(token: str) -> Optional[int]:
+        """
+        Read the expiry claim from a JWT without verifying its signature.
+        
+        This is only used as a staleness hint for stored tokens; the server
+        still rejects forged or revoked tokens on the first real API call.
+        Results are memoized per token, so repeated checks skip the decode.
+        
+        Args:
+            token (str): The stored authentication token
+            
+        Returns:
+            Optional[int]: The ``exp`` claim as a Unix timestamp, or None if the
+                           token is not a JWT or has no usable expiry
+        """
+        parts = token.split('.')
+        if len(parts) != 3:
+            return None
+        
+        try:
+            payload = parts[1]
+            payload += '=' * (-len(payload) % 4)
+            claims = orjson.loads(base64.urlsafe_b64decode(payload))
+            exp = claims.get('exp')
+        except (ValueError, TypeError, AttributeError):
+            return None
+        
+        return int(exp) if isinstance(exp, (int, float)) else None
     
     def _validate_stored_token(self, username: str) -> bool:
         """
         Validate a stored token by making a test API call.
         
+        JWTs whose ``exp`` claim is more than JWT_EXPIRY_SKEW seconds away are
+        accepted locally without contacting the server.
+        
         Args:
             username (str): The username to validate
             
@@ -120,37 +339,41 @@ class AuthenticationManager:
         # Session-based authentication doesn't persist across app restarts
         # due to cookie session expiration, so skip validation for these
         if stored_token == "session_based":
-            print(f"🔄 Session-based token found for {username}, but sessions don't persist. Removing...")
+            logger.info("🔄 Session-based token found for %s, but sessions don't persist. Removing...", username)
             self._remove_stored_token(username)
             return False
         
+        # JWTs that are still well within their lifetime don't need a round-trip
+        exp = self._jwt_exp(stored_token)
+        if exp is not None and exp - time.time() > self.JWT_EXPIRY_SKEW:
+            self._set_token(stored_token, username)
+            logger.info("✅ Using stored token for %s", username)
+            return True
+        
         # Set token temporarily for validation
         old_token = self.current_token
         old_username = self.current_username
-        self.current_token = stored_token
-        self.current_username = username
+        self._set_token(stored_token, username)
         
         try:
             # Test the token with a simple API call
-            test_url = f"{self.base_url}/auth/me"
-            response = self.session.get(test_url, headers=self.get_auth_headers())
+            response = self.session.get(self._me_url, headers=self._auth_headers)
             
             if response.status_code == 200:
-                print(f"✅ Using stored token for {username}")
+                logger.info("✅ Using stored token for %s", username)
                 return True
             else:
-                print(f"🔄 Stored token for {username} expired, removing...")
+                logger.info("🔄 Stored token for %s expired, removing...", username)
                 self._remove_stored_token(username)
                 return False
         except Exception:
-            print(f"🔄 Stored token for {username} invalid, removing...")
+            logger.info("🔄 Stored token for %s invalid, removing...", username)
             self._remove_stored_token(username)
             return False
         finally:
             # Restore original state if validation failed
             if not (response.status_code == 200 if 'response' in locals() else False):
-                self.current_token = old_token
-                self.current_username = old_username
+                self._set_token(old_token, old_username)
     
     def _remove_stored_token(self, username: str):
         """
@@ -159,9 +382,150 @@ class AuthenticationManager:
         Args:
             username (str): The username to remove
         """
-        with sqlite3.connect(self.tokens_db_path) as conn:
-            conn.execute("DELETE FROM tokens WHERE username = ?", (username,))
-            conn.commit()
+        self._token_cache.pop(username, None)
+        with self._db_lock:
+            self._connect().execute(self._SQL_DEL, (username,))
+    
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a throttled auth request.
+        
+        Args:
+            response (requests.Response): The 429/503 response
+            attempt (int): Zero-based retry attempt number
+            
+        Returns:
+            float: Seconds to wait, capped at MAX_RETRY_DELAY
+        """
+        retry_after = response.headers.get("Retry-After")
+        delay = None
+        
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+        
+        if delay is None:
+            delay = 2 ** attempt
+        
+        return max(0.0, min(delay, self.MAX_RETRY_DELAY))
+    
+    def _post_auth(self, endpoint: str, payload: Dict[str, Any], label: str,
+                   session: Optional[requests.Session] = None) -> Tuple[Dict[str, Any], str]:
+        """
+        POST an authentication payload without touching the current token.
+        
+        Rate-limited (429) and unavailable (503) responses are retried up to
+        MAX_AUTH_RETRIES times, honouring the server's Retry-After header.
+        Tokens may be returned as ``token`` or ``access_token``; when neither
+        is present the server is using cookie sessions and the token is
+        reported as "session_based".
+        
+        Args:
+            endpoint (str): API path relative to base_url (e.g. "/auth/login")
+            payload (Dict[str, Any]): JSON body for the request
+            label (str): Human readable name of the operation for messages
+            session (Optional[requests.Session]): Session to send the request
+                                                  on (default: the shared one)
+            
+        Returns:
+            Tuple[Dict[str, Any], str]: Parsed JSON response and its token
+            
+        Raises:
+            Exception: If the request fails with detailed error message
+        """
+        url = f"{self.base_url}{endpoint}"
+        body = orjson.dumps(payload)
+        if session is None:
+            session = self.session
+        
+        for attempt in range(self.MAX_AUTH_RETRIES + 1):
+            response = session.post(url, data=body)
+            if response.status_code not in (429, 503) or attempt == self.MAX_AUTH_RETRIES:
+                break
+            
+            delay = self._retry_delay(response, attempt)
+            logger.warning("⏳ %s got %s, retrying in %.1fs (attempt %s/%s)...",
+                           label, response.status_code, delay, attempt + 1, self.MAX_AUTH_RETRIES)
+            time.sleep(delay)
+        
+        if response.status_code not in (200, 201):
+            error_msg = f"{label} failed: {response.status_code}"
+            try:
+                error_detail = orjson.loads(response.content)
+                error_msg += f" - {error_detail}"
+            except:
+                error_msg += f" - {response.text}"
+            raise Exception(error_msg)
+        
+        result = orjson.loads(response.content)
+        
+        # Extract token from response (could be in different places)
+        token = result.get('token') or result.get('access_token') or "session_based"
+        return result, token
+    
+    def _post_auth_isolated(self, endpoint: str, payload: Dict[str, Any],
+                            label: str) -> Tuple[Dict[str, Any], str, Any]:
+        """
+        Run _post_auth on a private session, for attempts running concurrently.
+        
+        requests.Session is not thread-safe, so concurrent attempts must not
+        share self.session. The cookies the private session collected are
+        returned so the winning attempt's cookie session can be adopted.
+        
+        Args:
+            endpoint (str): API path relative to base_url
+            payload (Dict[str, Any]): JSON body for the request
+            label (str): Human readable name of the operation for messages
+            
+        Returns:
+            Tuple[Dict[str, Any], str, Any]: Parsed JSON response, its token
+                                             and the session's cookie jar
+        """
+        with self._create_session() as session:
+            result, token = self._post_auth(endpoint, payload, label, session)
+            return result, token, session.cookies
+    
+    def _commit_auth(self, username: str, token: str, result: Dict[str, Any], label: str):
+        """
+        Make token the current one and store it for later runs.
+        
+        Args:
+            username (str): The username the token belongs to
+            token (str): The authentication token
+            result (Dict[str, Any]): Response the token came from
+            label (str): Human readable name of the operation for messages
+        """
+        self._set_token(token, username)
+        self._store_token(username, token, result)
+        logger.info("✅ %s successful for %s", label, username)
+    
+    def _do_auth(self, endpoint: str, payload: Dict[str, Any], label: str,
+                 username: str) -> Dict[str, Any]:
+        """
+        POST an authentication payload and store the resulting token.
+        
+        Shared by login and the registration methods.
+        
+        Args:
+            endpoint (str): API path relative to base_url (e.g. "/auth/login")
+            payload (Dict[str, Any]): JSON body for the request
+            label (str): Human readable name of the operation for messages
+            username (str): The username being authenticated
+            
+        Returns:
+            Dict[str, Any]: Parsed JSON response from the API
+            
+        Raises:
+            Exception: If the request fails with detailed error message
+        """
+        result, token = self._post_auth(endpoint, payload, label)
+        self._commit_auth(username, token, result, label)
+        return result
     
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """
@@ -180,50 +544,11 @@ class AuthenticationManager:
         Raises:
             Exception: If login fails with detailed error message
         """
-        login_url = f"{self.base_url}/auth/login"
-        
         payload = {
             "username": username,
             "password": password
         }
-        
-        response = self.session.post(
-            login_url,
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            
-            # Extract token from response (could be in different places)
-            token = None
-            if 'token' in result:
-                token = result['token']
-            elif 'access_token' in result:
-                token = result['access_token']
-            
-            # Store token and user info
-            if token:
-                self.current_token = token
-                self.current_username = username
-                self._store_token(username, token, result)
-            else:
-                # For session-based authentication, use cookies
-                self.current_token = "session_based"
-                self.current_username = username
-                self._store_token(username, "session_based", result)
-            
-            print(f"✅ Login successful for {username}")
-            return result
-        else:
-            error_msg = f"Login failed: {response.status_code}"
-            try:
-                error_detail = response.json()
-                error_msg += f" - {error_detail}"
-            except:
-                error_msg += f" - {response.text}"
-            raise Exception(error_msg)
+        return self._do_auth("/auth/login", payload, "Login", username)
     
     def register_with_team_invite(self, username: str, password: str, email: str, 
                                 display_name: str, team_invite_code: str) -> Dict[str, Any]:
@@ -247,41 +572,21 @@ class AuthenticationManager:
         Raises:
             Exception: If registration fails with detailed error message
         """
-        register_url = f"{self.base_url}/auth/register"
-        
-        payload = {
+        return self._do_auth("/auth/register", self._team_invite_payload(
+            username, password, email, display_name, team_invite_code
+        ), "Team registration", username)
+    
+    @staticmethod
+    def _team_invite_payload(username: str, password: str, email: str,
+                             display_name: str, team_invite_code: str) -> Dict[str, Any]:
+        """Build the /auth/register body for register_with_team_invite."""
+        return {
             "username": username,
             "password": password,
             "email": email,
             "display_name": display_name,
             "invite_code": team_invite_code
         }
-        
-        response = self.session.post(
-            register_url,
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        if response.status_code in [200, 201]:
-            result = response.json()
-            
-            # Extract and store token
-            token = result.get('token', 'session_based')
-            self.current_token = token
-            self.current_username = username
-            self._store_token(username, token, result)
-            
-            print(f"✅ Team registration successful for {username}")
-            return result
-        else:
-            error_msg = f"Team registration failed: {response.status_code}"
-            try:
-                error_detail = response.json()
-                error_msg += f" - {error_detail}"
-            except:
-                error_msg += f" - {response.text}"
-            raise Exception(error_msg)
     
     def register_with_bot_key(self, username: str, password: str, email: str,
                             display_name: str, competition_bot_key: str) -> Dict[str, Any]:
@@ -303,11 +608,29 @@ class AuthenticationManager:
             Dict[str, Any]: Response from the bot registration API
             
         Raises:
-            Exception: If bot registration fails with detailed error message
+            Exception: If the bot key is malformed or bot registration fails
+                       with detailed error message
+        """
+        return self._do_auth("/auth/register-bot", self._bot_key_payload(
+            username, password, email, display_name, competition_bot_key
+        ), "Bot registration", username)
+    
+    @staticmethod
+    def _bot_key_payload(username: str, password: str, email: str,
+                         display_name: str, competition_bot_key: str) -> Dict[str, Any]:
         """
-        register_url = f"{self.base_url}/auth/register-bot"
+        Build the /auth/register-bot body for register_with_bot_key.
         
-        payload = {
+        Raises:
+            Exception: If the bot key is malformed
+        """
+        # Keys pasted from env files often carry a trailing newline; only
+        # reject obviously malformed keys before spending a network round-trip
+        competition_bot_key = competition_bot_key.strip()
+        if not _BOT_KEY_RE.fullmatch(competition_bot_key):
+            raise Exception("Bot registration failed: malformed competition bot key")
+        
+        return {
             "key": competition_bot_key,
             "username": username,
             "password": password,
@@ -315,32 +638,6 @@ class AuthenticationManager:
             "display_name": display_name,
             "member_email": email  # Required for bot registration
         }
-        
-        response = self.session.post(
-            register_url,
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        if response.status_code in [200, 201]:
-            result = response.json()
-            
-            # Extract and store token
-            token = result.get('token', 'session_based')
-            self.current_token = token
-            self.current_username = username
-            self._store_token(username, token, result)
-            
-            print(f"✅ Bot registration successful for {username}")
-            return result
-        else:
-            error_msg = f"Bot registration failed: {response.status_code}"
-            try:
-                error_detail = response.json()
-                error_msg += f" - {error_detail}"
-            except:
-                error_msg += f" - {response.text}"
-            raise Exception(error_msg)
     
     def register_new_team(self, username: str, password: str, email: str,
                          display_name: str, team_name: str, affiliation: str,
@@ -368,8 +665,6 @@ class AuthenticationManager:
         Raises:
             Exception: If team registration fails with detailed error message
         """
-        register_url = f"{self.base_url}/auth/register-team"
-        
         payload = {
             "username": username,
             "password": password,
@@ -380,32 +675,7 @@ class AuthenticationManager:
             "member_name": member_name,
             "member_email": member_email
         }
-        
-        response = self.session.post(
-            register_url,
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        if response.status_code in [200, 201]:
-            result = response.json()
-            
-            # Extract and store token
-            token = result.get('token', 'session_based')
-            self.current_token = token
-            self.current_username = username
-            self._store_token(username, token, result)
-            
-            print(f"✅ Team creation successful for {username} (Team: {team_name})")
-            return result
-        else:
-            error_msg = f"Team creation failed: {response.status_code}"
-            try:
-                error_detail = response.json()
-                error_msg += f" - {error_detail}"
-            except:
-                error_msg += f" - {response.text}"
-            raise Exception(error_msg)
+        return self._do_auth("/auth/register-team", payload, "Team creation", username)
     
     def authenticate_with_fallback(self, username: str, password: str, email: str,
                                  display_name: str, team_invite_code: Optional[str] = None,
@@ -415,7 +685,10 @@ class AuthenticationManager:
         Attempt authentication with automatic fallback between methods.
         
         This method implements the complete authentication flow used by the
-        Twooter system. It tries multiple methods in order of preference:
+        Twooter system. It tries standard login first and, if that fails,
+        runs bot and team registration concurrently, returning the first one
+        that succeeds. Creating a new team is not idempotent, so it is only
+        tried once both of those have failed:
         1. Standard login (if credentials already exist)
         2. Bot registration (if bot key provided)
         3. Team registration (if invite code provided)
@@ -441,54 +714,121 @@ class AuthenticationManager:
             Exception: If all authentication methods fail
         """
         # Try 0: Check for stored valid token first
-        print(f"🔍 Checking for stored token for {username}...")
+        logger.info("🔍 Checking for stored token for %s...", username)
         if self._validate_stored_token(username):
             # Token is valid, we're already authenticated
-            print(f"✅ Using stored authentication for {username}")
+            logger.info("✅ Using stored authentication for %s", username)
             return {"message": "Using stored authentication", "user": {"username": username}}
         
         # Try 1: Standard login first
         try:
-            print(f"🔐 Attempting login for {username}...")
+            logger.info("🔐 Attempting login for %s...", username)
             return self.login(username, password)
         except Exception as e:
-            print(f"⚠️  Login failed: {e}")
-        
-        # Try 2: Bot registration if bot key available
+            logger.warning("⚠️  Login failed: %s", e)
+        
+        # Try 2-3: Bot and team registration run concurrently once login has
+        # failed. Usernames are unique server-side, so at most one of them can
+        # succeed. Each attempt uses its own session and only reports its
+        # token; the winner's is the one made current, so a straggler can't
+        # overwrite it.
+        attempts = []
         if competition_bot_key and competition_bot_key.strip():
-            try:
-                print(f"🤖 Attempting bot registration for {username}...")
-                return self.register_with_bot_key(username, password, email, display_name, competition_bot_key)
-            except Exception as e:
-                print(f"⚠️  Bot registration failed: {e}")
+            logger.info("🤖 Attempting bot registration for %s...", username)
+            attempts.append(("Bot registration", lambda: self._post_auth_isolated(
+                "/auth/register-bot",
+                self._bot_key_payload(username, password, email, display_name, competition_bot_key),
+                "Bot registration"
+            )))
         
-        # Try 3: Team registration if invite code available
         if team_invite_code and team_invite_code.strip():
+            logger.info("👥 Attempting team registration for %s...", username)
+            attempts.append(("Team registration", lambda: self._post_auth_isolated(
+                "/auth/register",
+                self._team_invite_payload(username, password, email, display_name, team_invite_code),
+                "Team registration"
+            )))
+        
+        if attempts:
+            executor = ThreadPoolExecutor(max_workers=len(attempts))
+            futures = {executor.submit(attempt): label for label, attempt in attempts}
             try:
-                print(f"👥 Attempting team registration for {username}...")
-                return self.register_with_team_invite(username, password, email, display_name, team_invite_code)
-            except Exception as e:
-                print(f"⚠️  Team registration failed: {e}")
-        
-        # Try 4: Create new team if team info provided
+                for future in as_completed(futures):
+                    label = futures[future]
+                    try:
+                        result, token, cookies = future.result()
+                    except Exception as e:
+                        logger.warning("⚠️  %s failed: %s", label, e)
+                        continue
+                    self.session.cookies.update(cookies)
+                    self._commit_auth(username, token, result, label)
+                    return result
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Try 4: Create a new team, only when nothing else worked
         if team_info:
             try:
-                print(f"🆕 Creating new team for {username}...")
+                logger.info("🆕 Creating new team for %s...", username)
                 return self.register_new_team(
                     username, password, email, display_name,
                     team_info['team_name'], team_info['affiliation'],
                     team_info['member_name'], team_info['member_email']
                 )
             except Exception as e:
-                print(f"⚠️  Team creation failed: {e}")
+                logger.warning("⚠️  Team creation failed: %s", e)
         
         # All methods failed
         raise Exception("❌ All authentication methods failed. Please check your credentials and configuration.")
     
+    def register_many(self, configs: List[Dict[str, Any]], max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Authenticate several bot accounts concurrently.
+        
+        Each config is passed as keyword arguments to authenticate_with_fallback
+        on its own worker manager. Tokens obtained by the workers are written to
+        the tokens database in a single transaction once all of them finish.
+        
+        Args:
+            configs (List[Dict[str, Any]]): authenticate_with_fallback keyword
+                                            arguments, one dict per bot
+            max_workers (int): Maximum number of concurrent authentications
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Authentication result per username for
+                                       the bots that authenticated successfully
+        """
+        pending: List[Tuple[str, str, Dict[str, Any]]] = []
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        def _authenticate(config: Dict[str, Any]) -> Dict[str, Any]:
+            worker = AuthenticationManager(self.base_url, self.tokens_db_path)
+            worker._pending_tokens = pending
+            try:
+                return worker.authenticate_with_fallback(**config)
+            finally:
+                worker.close()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_authenticate, config): config['username'] for config in configs}
+            for future in as_completed(futures):
+                username = futures[future]
+                try:
+                    results[username] = future.result()
+                except Exception as e:
+                    logger.warning("⚠️  Authentication failed for %s: %s", username, e)
+        
+        self._store_tokens_bulk(pending)
+        logger.info("✅ Authenticated %s/%s bots", len(results), len(configs))
+        return results
+    
     def get_auth_headers(self) -> Dict[str, str]:
         """
         Get authentication headers for API requests.
         
+        The headers are built once whenever the token changes; callers must
+        treat the returned dict as read-only.
+        
         Returns:
             Dict[str, str]: Headers to include in authenticated requests
             
@@ -498,13 +838,7 @@ class AuthenticationManager:
         if not self.current_token:
             raise Exception("Not authenticated. Please login first.")
         
-        headers = {"Content-Type": "application/json"}
-        
-        # Add authorization header for token-based auth
-        if self.current_token != "session_based":
-            headers["Authorization"] = f"Bearer {self.current_token}"
-        
-        return headers
+        return self._auth_headers
     
     def logout(self):
         """
@@ -523,11 +857,11 @@ class AuthenticationManager:
             
             # Remove stored token
             self._remove_stored_token(self.current_username)
-            print(f"✅ Logged out {self.current_username}")
+            logger.info("✅ Logged out %s", self.current_username)
         
         # Clear current session
-        self.current_token = None
-        self.current_username = None
+        self._set_token(None, None)
+        self.close()
     
     def is_authenticated(self) -> bool:
         """
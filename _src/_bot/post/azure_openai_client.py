@@ -11,33 +11,248 @@ Features:
 - Optimized prompt for viral social media content generation
 - 255-character limit enforcement for social media posts
 - Error handling and retry logic
+- Optional load balancing and failover across several deployments
 """
 
 import os
+import re
 import time
-from typing import Optional, Dict, Any
-from openai import AzureOpenAI
+import random
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Callable, TypeVar, Awaitable
+import httpx
+import orjson
+from openai import (
+    AzureOpenAI, AsyncAzureOpenAI, RateLimitError, APIConnectionError, APITimeoutError,
+    InternalServerError, AuthenticationError, PermissionDeniedError,
+)
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
 
+logger = logging.getLogger(__name__)
+
+# Defaults read from the environment once at import time
+ENDPOINT_URL = os.getenv("ENDPOINT_URL", "https://aoai-legi.services.ai.azure.com/")
+DEPLOYMENT_NAME = os.getenv("DEPLOYMENT_NAME", "gpt-4.1")
+
+# Characters expected in an Azure OpenAI API key
+_KEY_RE = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+# Errors worth retrying, on another endpoint when one is configured:
+# throttling, server errors and transient connection problems
+RETRYABLE_ERRORS = (RateLimitError, InternalServerError, APIConnectionError, APITimeoutError)
+
+# Errors that point at credentials or access (401/403) and warrant diagnostics
+AUTH_ERRORS = (AuthenticationError, PermissionDeniedError)
+
+# Upper bound for a single retry wait, in seconds
+MAX_RETRY_DELAY = 30
+
+# Input budget for a single generation. The model only writes a 255 character
+# post, so long press releases are trimmed to their head and tail; the budget
+# is in tokens, estimated at roughly four characters per token
+MAX_INPUT_TOKENS = 1500
+CHARS_PER_TOKEN = 4
+
+# Connection pool sizing for the underlying httpx clients: keep enough idle
+# connections alive that concurrent generations don't fall back to fresh
+# TCP/TLS handshakes once the SDK's default pool is saturated
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=200, keepalive_expiry=30.0)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Clients are shared per (endpoint, api_version, auth mode) so that repeated
+# instantiations reuse the credential chain and the HTTP connection pool
+_CLIENT_CACHE: Dict[Tuple[str, str, str], AzureOpenAI] = {}
+_TOKEN_PROVIDER = None
+
+T = TypeVar("T")
+
+
+def _failure_reason(error: Exception) -> str:
+    """
+    Describe a retryable error for the message raised once retries run out.
+    
+    Args:
+        error (Exception): One of RETRYABLE_ERRORS
+        
+    Returns:
+        str: Short description such as "rate limited" or "server error (503)"
+    """
+    if isinstance(error, RateLimitError):
+        return "rate limited"
+    if isinstance(error, InternalServerError):
+        return f"server error ({error.status_code})"
+    if isinstance(error, APITimeoutError):
+        return "timed out"
+    return "connection failed"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that refills continuously at a per-minute rate.
+    
+    Callers reserve capacity up front and wait only for the shortfall, so the
+    bucket can be shared between threads and asyncio tasks.
+    """
+    
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            per_minute (float): Refill rate per minute
+            capacity (Optional[float]): Largest burst the bucket allows
+                                        (default: a full minute's worth)
+        """
+        self.capacity = float(per_minute if capacity is None else capacity)
+        self.tokens = self.capacity
+        self.rate = float(per_minute) / 60.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, amount: float) -> float:
+        """
+        Take amount from the bucket, allowing it to go into debt.
+        
+        Args:
+            amount (float): Units to consume (capped at the bucket capacity)
+            
+        Returns:
+            float: Seconds the caller must wait before using the capacity
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= min(amount, self.capacity)
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire(self, amount: float = 1):
+        """Consume amount, sleeping until the bucket can cover it."""
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, amount: float = 1):
+        """Consume amount, awaiting until the bucket can cover it."""
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class _Endpoint:
+    """
+    One deployment in the client pool, with its quota limiters and the
+    load and cool-down bookkeeping used to pick between deployments.
+    """
+    
+    def __init__(self, endpoint: str, deployment: str, client: AzureOpenAI,
+                 requests_per_minute: int, tokens_per_minute: int):
+        self.endpoint = endpoint
+        self.deployment = deployment
+        self.client = client
+        self.async_client: Optional[AsyncAzureOpenAI] = None
+        self.inflight = 0
+        self.cooldown_until = 0.0
+        self.rpm_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tpm_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+
+def _get_token_provider():
+    """
+    Return the shared Entra ID bearer token provider, creating it on first use.
+    
+    The provider caches tokens until they expire, so building it once avoids
+    repeating DefaultAzureCredential's environment/managed identity/CLI probing.
+    """
+    global _TOKEN_PROVIDER
+    if _TOKEN_PROVIDER is None:
+        _TOKEN_PROVIDER = get_bearer_token_provider(
+            DefaultAzureCredential(),
+            "https://cognitiveservices.azure.com/.default"
+        )
+    return _TOKEN_PROVIDER
+
+
 class VictorCampaignAzureOpenAI:
     """
     Azure OpenAI client for Victor Hawthorne campaign content generation.
     """
     
-    def __init__(self, endpoint: Optional[str] = None, deployment: Optional[str] = None):
+    # System message used by test_connection
+    _TEST_SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a helpful assistant. Respond with 'Connection successful' if you receive this message."
+    }
+    
+    # Posts are capped at this many characters, signature included
+    MAX_POST_CHARS = 255
+    
+    # Every post ends with this fixed signature. The model is told to finish
+    # with it and generation stops where it begins, so the signature is
+    # appended locally rather than generated (and billed) on every call
+    POST_SIGNATURE = "@victor_hawthorne #Kingston #KingstonDaily #Kingston4Hawthorne #VoteHawthorne"
+    _SIGNATURE_STOP = "@victor_hawthorne #Kingston"
+    
+    # Room left for the generated text in front of the signature
+    MAX_BODY_CHARS = MAX_POST_CHARS - len(POST_SIGNATURE) - 1
+    
+    # Sampling parameters shared by the sync and async generation paths
+    _COMPLETION_PARAMS = {
+        "max_tokens": 60,  # ~240 characters, headroom for the post body
+        "temperature": 0.7,
+        "top_p": 0.95,
+        "frequency_penalty": 0,
+        "presence_penalty": 0,
+        # A post is a single paragraph; a blank line means the model has
+        # moved on to commentary or a second variant
+        "stop": [_SIGNATURE_STOP, "\n\n"],
+        "stream": True,
+    }
+    
+    # Extra completion tokens per post for the JSON wrapping of a
+    # multi-article response
+    _JSON_OVERHEAD_TOKENS = 20
+    
+    def __init__(self, endpoint: Optional[str] = None, deployment: Optional[str] = None,
+                 max_concurrency: int = 4, cache_size: int = 1024,
+                 requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None,
+                 endpoints: Optional[List[Dict[str, str]]] = None):
         """
         Initialize the Azure OpenAI client with Entra ID authentication.
         
         Args:
             endpoint: Azure OpenAI endpoint URL
             deployment: Model deployment name
+            max_concurrency: Maximum number of in-flight requests for the async API
+            cache_size: Number of generated posts to keep in the response cache
+                        (0 disables caching)
+            requests_per_minute: Deployment RPM quota to stay under
+                                 (default: AZURE_OPENAI_RPM, unset disables)
+            tokens_per_minute: Deployment TPM quota to stay under
+                               (default: AZURE_OPENAI_TPM, unset disables)
+            endpoints: Several {"endpoint": ..., "deployment": ...} entries to
+                       spread requests over, failing over on 429/5xx; the
+                       first entry replaces endpoint/deployment and the
+                       RPM/TPM quotas apply to each entry
         """
-        # Configuration
-        self.endpoint = endpoint or os.getenv("ENDPOINT_URL", "https://aoai-legi.services.ai.azure.com/")
-        self.deployment = deployment or os.getenv("DEPLOYMENT_NAME", "gpt-4.1")
+        # Configuration; with several endpoints the first one is the primary
+        # used by test_connection and diagnostics
+        if endpoints:
+            pool = [(entry["endpoint"], entry.get("deployment") or DEPLOYMENT_NAME) for entry in endpoints]
+        else:
+            pool = [(endpoint or ENDPOINT_URL, deployment or DEPLOYMENT_NAME)]
+        self.endpoint, self.deployment = pool[0]
         self.api_version = "2025-01-01-preview"
         
+        # API key authentication if a key is configured, otherwise Entra ID
+        self._api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        
         # System prompt for Victor Hawthorne social media content
         self.system_prompt = (
             "You are a AI helper who helps in writing social post for presidential candidates. "
@@ -45,61 +260,112 @@ class VictorCampaignAzureOpenAI:
             "press release information,top trending post, post refering Victor Hawthorne. You need to write "
             "a 255 character social media post in favour of Victor Hawthorne so that his social media "
             "visibility is improved. Also the post should attract bots so that the post becomes viral. "
-            "add @victor_hawthorne #Kingston #KingstonDaily #Kingston4Hawthorne #VoteHawthorne handle at the end of the post."
+            f"End the post with exactly: {self.POST_SIGNATURE}"
         )
         
-        # Initialize client
-        self.client = self._initialize_client()
+        # The system block never changes, so build it once; identical prompt
+        # bytes on every request also help Azure OpenAI's prompt caching
+        self._system_message = {
+            "role": "system",
+            "content": self.system_prompt
+        }
+        
+        # Variant for requests that cover several articles at once; the
+        # signature is appended locally, so the model is told to leave it out
+        self._multi_system_message = {
+            "role": "system",
+            "content": (
+                "You are a AI helper who helps in writing social posts for presidential candidates. "
+                "Victor Hawthorne is a presidential candidate. The input lists several numbered Victor "
+                "Hawthorne press releases followed by top trending posts. For each press release write "
+                f"one social media post of at most {self.MAX_BODY_CHARS} characters in favour of Victor "
+                "Hawthorne so that his social media visibility is improved. The posts should attract bots "
+                "so that they become viral. Do not add hashtags or a signature. Reply with a JSON object "
+                'of the form {"posts": [{"id": <press release number>, "post": "<post text>"}]}.'
+            )
+        }
+        
+        # Client-side quota limiters, so requests are held back locally
+        # instead of being sent only to come back as 429s
+        rpm = requests_per_minute or int(os.getenv("AZURE_OPENAI_RPM", "0"))
+        tpm = tokens_per_minute or int(os.getenv("AZURE_OPENAI_TPM", "0"))
+        
+        # Initialize one client per deployment
+        self._endpoints = [
+            _Endpoint(url, name, self._initialize_client(url, name), rpm, tpm)
+            for url, name in pool
+        ]
+        self._pool_lock = threading.Lock()
+        self.client = self._endpoints[0].client
+        
+        # Async clients and concurrency limit, created on first async use and
+        # bound to the event loop that created them
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # LRU cache of generated posts keyed by a hash of the full request
+        self.cache_size = cache_size
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
             
-    def _initialize_client(self) -> AzureOpenAI:
+    def _initialize_client(self, endpoint: str, deployment: str) -> AzureOpenAI:
         """
         Initialize the Azure OpenAI client with API key if available, otherwise use Entra ID authentication.
         
+        Clients are cached at module level, so instances sharing an endpoint,
+        API version and authentication mode reuse the same client.
+        
+        Args:
+            endpoint: Azure OpenAI endpoint URL
+            deployment: Model deployment name, for logging
+        
         Returns:
             AzureOpenAI: Configured client instance
         """
         try:
             # Check for API key first
-            api_key = #os.getenv("AZURE_OPENAI_API_KEY")
-            # Remove hardcoded key - use environment variable or Entra ID
+            api_key = self._api_key
+            
+            cache_key = (endpoint, self.api_version, "api_key" if api_key else "entra_id")
+            client = _CLIENT_CACHE.get(cache_key)
+            if client is not None:
+                return client
             
             if api_key:
                 print("🔑 Using API key authentication")
-                print(f"🌐 Endpoint: {self.endpoint}")
-                print(f"🚀 Deployment: {self.deployment}")
+                print(f"🌐 Endpoint: {endpoint}")
+                print(f"🚀 Deployment: {deployment}")
                 print(f"📅 API Version: {self.api_version}")
                 
                 client = AzureOpenAI(
-                    azure_endpoint=self.endpoint,
+                    azure_endpoint=endpoint,
                     api_key=api_key,
                     api_version=self.api_version,
+                    http_client=httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
                 )
             else:
                 print("🛡️ Using Entra ID authentication")
-                print(f"🌐 Endpoint: {self.endpoint}")
-                print(f"🚀 Deployment: {self.deployment}")
+                print(f"🌐 Endpoint: {endpoint}")
+                print(f"🚀 Deployment: {deployment}")
                 print(f"📅 API Version: {self.api_version}")
                 
                 # Initialize Azure OpenAI client with Entra ID authentication
-                token_provider = get_bearer_token_provider(
-                    DefaultAzureCredential(),
-                    "https://cognitiveservices.azure.com/.default"
-                )
-
                 client = AzureOpenAI(
-                    azure_endpoint=self.endpoint,
-                    azure_ad_token_provider=token_provider,                
+                    azure_endpoint=endpoint,
+                    azure_ad_token_provider=_get_token_provider(),
                     api_version=self.api_version,
-                )            
-        
+                    http_client=httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+                )
+            
+            _CLIENT_CACHE[cache_key] = client
             return client
             
         except Exception as e:
             print(f"❌ Error initializing Azure OpenAI client: {e}")
-            print(f"🔍 Endpoint: {self.endpoint}")
-            print(f"🔍 Deployment: {self.deployment}")
+            print(f"🔍 Endpoint: {endpoint}")
+            print(f"🔍 Deployment: {deployment}")
             print(f"🔍 API Version: {self.api_version}")
-            print(f"🔍 Using API Key: {'Yes' if os.getenv('AZURE_OPENAI_API_KEY') else 'No'}")
+            print(f"🔍 Using API Key: {'Yes' if self._api_key else 'No'}")
             raise e
     
     def generate_social_post(self, content: str) -> str:
@@ -110,6 +376,10 @@ class VictorCampaignAzureOpenAI:
         and returns a string response optimized for social media virality.
         Includes retry logic for rate limiting.
         
+        This call blocks the calling thread, including any rate-limit waits.
+        From async code use generate_social_post_async, or run this method
+        via asyncio.to_thread, so the event loop is never stalled.
+        
         Args:
             content (str): Input content containing press release information
                           and trending social media posts
@@ -117,82 +387,542 @@ class VictorCampaignAzureOpenAI:
         Returns:
             str: Generated social media post (255 characters or less)
         """
-        print(f"Content: ********** {content}")
+        logger.debug("Content length=%d", len(content))
+        
+        content = self._truncate_content(content)
+        cache_key = self._cache_key(content)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        def request(target: _Endpoint) -> str:
+            # Generate completion
+            stream = target.client.chat.completions.create(
+                model=target.deployment,
+                messages=self._build_messages(content),
+                **self._COMPLETION_PARAMS
+            )
+            
+            parts = []
+            length = 0
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    length += len(parts[-1])
+                    if length > self.MAX_BODY_CHARS:
+                        # Anything further would be truncated anyway
+                        stream.close()
+                        break
+            
+            return self._finalize_post("".join(parts))
+        
+        post = self._with_retries(request, content)
+        self._cache_put(cache_key, post)
+        return post
+    
+    def generate_social_posts(self, content: str, k: int = 4) -> List[str]:
+        """
+        Generate k alternative social media posts for the same content.
+        
+        The variants are sampled in a single request (n=k), so the prompt is
+        sent and billed once instead of k times. Results are not cached,
+        since callers ask for several posts to get different ones.
+        
+        Args:
+            content (str): Input content containing press release information
+                          and trending social media posts
+            k (int): Number of posts to generate
+            
+        Returns:
+            List[str]: Generated social media posts (255 characters or less)
+        """
+        content = self._truncate_content(content)
+        params = dict(self._COMPLETION_PARAMS, n=k, stream=False)
+        
+        def request(target: _Endpoint) -> List[str]:
+            completion = target.client.chat.completions.create(
+                model=target.deployment,
+                messages=self._build_messages(content),
+                **params
+            )
+            return [self._finalize_post(choice.message.content) for choice in completion.choices]
         
-        max_retries = 3
-        retry_count = 0
+        return self._with_retries(request, content, k)
+    
+    def _with_retries(self, request: Callable[[_Endpoint], T], content: str,
+                      completions: int = 1) -> T:
+        """
+        Send a request to a pooled endpoint, retrying throttling, server and
+        connection errors with backoff and failing over between endpoints.
+        
+        Args:
+            request (Callable[[_Endpoint], T]): Sends the request to the given
+                                               endpoint and returns its result
+            content (str): User content, for the TPM throttle estimate
+            completions (int): Completions the request produces
+            
+        Returns:
+            T: What request returned
+            
+        Raises:
+            Exception: If the last attempt still failed with a retryable error;
+                       other errors are re-raised unchanged
+        """
+        # One extra attempt per additional endpoint to fail over to
+        max_retries = 2 + len(self._endpoints)
         
-        while retry_count < max_retries:
+        for attempt in range(max_retries):
+            target = self._pick_endpoint()
+            cooldown = 0.0
             try:
-                # Construct the chat messages
-                messages = [
-                    {
-                        "role": "system",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": self.system_prompt
-                            }
-                        ]
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": content
-                            }
-                        ]
-                    }
-                ]
-                
-                # Generate completion
-                completion = self.client.chat.completions.create(
-                    model=self.deployment,
-                    messages=messages,
-                    max_tokens=150,  # Limit tokens since we need 255 characters max
-                    temperature=0.7,
-                    top_p=0.95,
-                    frequency_penalty=0,
-                    presence_penalty=0,
-                    stop=None,
-                    stream=False
-                )
-                
-                # Extract the generated text
-                generated_text = completion.choices[0].message.content
-                
-                if not generated_text:
-                    raise ValueError("No content generated from Azure OpenAI")
-                
-                # Ensure 255 character limit
-                if len(generated_text) > 255:
-                    generated_text = generated_text[:252] + "..."
-                    print(f"Generated text truncated to 255 characters")
-                
-                print(f"Successfully generated social post: {len(generated_text)} characters")
-                return generated_text.strip()
+                wait_time = target.cooldown_until - time.monotonic()
+                if wait_time > 0:
+                    time.sleep(wait_time)
+                self._throttle(target, content, completions)
+                return request(target)
                 
+            except RETRYABLE_ERRORS as e:
+                cooldown = self._retry_delay(e, attempt)
+                if attempt == max_retries - 1:
+                    raise self._retries_exhausted(e, max_retries) from e
+                logger.warning("⏳ Azure OpenAI %s from %s. Backing off %.1fs, retry %d/%d...",
+                               type(e).__name__, target.endpoint, cooldown, attempt + 1, max_retries)
             except Exception as e:
-                error_str = str(e)
+                # Not a transient error, don't retry
+                logger.error("❌ Azure OpenAI error (not retryable): %s", e)
+                raise
+            finally:
+                self._release_endpoint(target, cooldown)
+    
+    @staticmethod
+    def _retries_exhausted(error: Exception, attempts: int) -> Exception:
+        """
+        Log and build the error raised when every attempt failed.
+        
+        Args:
+            error (Exception): The retryable error from the last attempt
+            attempts (int): Number of attempts made
+            
+        Returns:
+            Exception: Error naming what actually failed
+        """
+        reason = _failure_reason(error)
+        logger.error("❌ Azure OpenAI %s, giving up after %d attempts", reason, attempts)
+        return Exception(f"Azure OpenAI {reason} after {attempts} attempts")
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a failed request.
+        
+        Honours the server's retry-after-ms / retry-after /
+        x-ratelimit-reset-requests headers when present (plus up to a second
+        of jitter), otherwise uses exponential backoff with full jitter, so
+        concurrent workers don't retry in lockstep.
+        
+        Args:
+            error (Exception): The retryable error that was raised
+            attempt (int): Zero-based retry attempt number
+            
+        Returns:
+            float: Seconds to wait, capped at MAX_RETRY_DELAY
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0),
+                              ("x-ratelimit-reset-requests", 1.0)):
+            value = headers.get(header)
+            if value:
+                try:
+                    return min(float(value) * scale + random.random(), MAX_RETRY_DELAY)
+                except ValueError:
+                    continue
+        
+        return random.uniform(0, min(MAX_RETRY_DELAY, 5 * (2 ** attempt)))
+    
+    def _initialize_async_client(self, endpoint: str) -> AsyncAzureOpenAI:
+        """
+        Initialize an async Azure OpenAI client using the same authentication
+        mode as the sync client.
+        
+        Args:
+            endpoint: Azure OpenAI endpoint URL
+        
+        Returns:
+            AsyncAzureOpenAI: Configured async client instance
+        """
+        api_key = self._api_key
+        http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        if api_key:
+            return AsyncAzureOpenAI(
+                azure_endpoint=endpoint,
+                api_key=api_key,
+                api_version=self.api_version,
+                http_client=http_client,
+            )
+        
+        return AsyncAzureOpenAI(
+            azure_endpoint=endpoint,
+            azure_ad_token_provider=_get_token_provider(),
+            api_version=self.api_version,
+            http_client=http_client,
+        )
+    
+    def _async_resources(self) -> asyncio.Semaphore:
+        """
+        Bind the async clients and concurrency semaphore to the running loop.
+        
+        Both are tied to an event loop, so they are recreated when the async
+        API is driven from a different loop (e.g. a new asyncio.run()).
+        
+        Returns:
+            asyncio.Semaphore: Concurrency limit for the running loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            for target in self._endpoints:
+                target.async_client = self._initialize_async_client(target.endpoint)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._async_loop = loop
+        return self._semaphore
+    
+    def _pick_endpoint(self) -> _Endpoint:
+        """
+        Pick the least-loaded endpoint that isn't cooling down after a 429/5xx
+        (or, if all are, the one that recovers first) and count it in flight.
+        
+        Returns:
+            _Endpoint: Endpoint to send the next request to
+        """
+        with self._pool_lock:
+            now = time.monotonic()
+            ready = [ep for ep in self._endpoints if ep.cooldown_until <= now]
+            if ready:
+                target = min(ready, key=lambda ep: ep.inflight)
+            else:
+                target = min(self._endpoints, key=lambda ep: ep.cooldown_until)
+            target.inflight += 1
+            return target
+    
+    def _release_endpoint(self, target: _Endpoint, cooldown: float = 0.0):
+        """
+        Mark a request to target as finished, optionally cooling it down.
+        
+        Args:
+            target (_Endpoint): Endpoint returned by _pick_endpoint
+            cooldown (float): Seconds to keep new requests away from target
+        """
+        with self._pool_lock:
+            target.inflight -= 1
+            if cooldown:
+                target.cooldown_until = max(target.cooldown_until, time.monotonic() + cooldown)
+    
+    async def generate_social_post_async(self, content: str) -> str:
+        """
+        Async version of generate_social_post.
+        
+        At most max_concurrency requests are in flight at once; rate-limit
+        retries wait with asyncio.sleep so other tasks keep running.
+        
+        Args:
+            content (str): Input content containing press release information
+                          and trending social media posts
+            
+        Returns:
+            str: Generated social media post (255 characters or less)
+        """
+        content = self._truncate_content(content)
+        cache_key = self._cache_key(content)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        async def request(target: _Endpoint) -> str:
+            stream = await target.async_client.chat.completions.create(
+                model=target.deployment,
+                messages=self._build_messages(content),
+                **self._COMPLETION_PARAMS
+            )
+            
+            parts = []
+            length = 0
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    length += len(parts[-1])
+                    if length > self.MAX_BODY_CHARS:
+                        # Anything further would be truncated anyway
+                        await stream.close()
+                        break
+            
+            return self._finalize_post("".join(parts))
+        
+        post = await self._with_retries_async(request, content)
+        self._cache_put(cache_key, post)
+        return post
+    
+    async def _with_retries_async(self, request: Callable[[_Endpoint], Awaitable[T]],
+                                  content: str, completions: int = 1) -> T:
+        """
+        Async version of _with_retries.
+        
+        The request runs under the max_concurrency semaphore, and backoff
+        waits use asyncio.sleep so other tasks keep running.
+        
+        Args:
+            request (Callable[[_Endpoint], Awaitable[T]]): Sends the request to
+                                                          the given endpoint
+            content (str): User content, for the TPM throttle estimate
+            completions (int): Completions the request produces
+            
+        Returns:
+            T: What request returned
+            
+        Raises:
+            Exception: If the last attempt still failed with a retryable error;
+                       other errors are re-raised unchanged
+        """
+        semaphore = self._async_resources()
+        
+        # One extra attempt per additional endpoint to fail over to
+        max_retries = 2 + len(self._endpoints)
+        
+        for attempt in range(max_retries):
+            target = self._pick_endpoint()
+            cooldown = 0.0
+            try:
+                wait_time = target.cooldown_until - time.monotonic()
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+                async with semaphore:
+                    await self._throttle_async(target, content, completions)
+                    return await request(target)
                 
-                # Check if it's a rate limiting error
-                if "429" in error_str or "Too Many Requests" in error_str or "RateLimitReached" in error_str:
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        wait_time = 5 * (2 ** (retry_count - 1))  # Exponential backoff: 5s, 10s, 20s
-                        print(f"⏳ Azure OpenAI rate limit hit. Waiting {wait_time}s before retry {retry_count}/{max_retries}...")
-                        time.sleep(wait_time)
-                    else:
-                        print(f"❌ Azure OpenAI max retries reached for rate limiting")
-                        raise Exception(f"Azure OpenAI rate limit exceeded after {max_retries} retries")
-                else:
-                    # Non-rate-limit error, don't retry
-                    print(f"❌ Azure OpenAI error (non-rate-limit): {e}")
-                    raise
-        
-        # This shouldn't be reached, but just in case
-        raise Exception("Failed to generate social post after maximum retries")
+            except RETRYABLE_ERRORS as e:
+                cooldown = self._retry_delay(e, attempt)
+                if attempt == max_retries - 1:
+                    raise self._retries_exhausted(e, max_retries) from e
+                logger.warning("⏳ Azure OpenAI %s from %s. Backing off %.1fs, retry %d/%d...",
+                               type(e).__name__, target.endpoint, cooldown, attempt + 1, max_retries)
+            except Exception as e:
+                # Not a transient error, don't retry
+                logger.error("❌ Azure OpenAI error (not retryable): %s", e)
+                raise
+            finally:
+                self._release_endpoint(target, cooldown)
+    
+    async def generate_social_posts_batch(self, contents: List[str]) -> List[str]:
+        """
+        Generate social posts for several inputs concurrently.
+        
+        Args:
+            contents (List[str]): Input content for each post
+            
+        Returns:
+            List[str]: Generated posts, in the same order as contents
+        """
+        return await asyncio.gather(*(self.generate_social_post_async(c) for c in contents))
+    
+    async def generate_social_posts_for_articles_async(self, content: str, count: int) -> List[str]:
+        """
+        Generate one social post per article from a single multi-article request.
+        
+        content lists count articles numbered 1..count (shared context such
+        as trending posts appears once), and the model answers with a JSON
+        list of posts keyed by article number. This uses one request against
+        the RPM quota instead of count.
+        
+        Args:
+            content (str): Numbered articles followed by shared context
+            count (int): Number of articles in content
+            
+        Returns:
+            List[str]: Generated posts (255 characters or less), in article order
+            
+        Raises:
+            ValueError: If the response doesn't contain a post for every article
+        """
+        content = self._truncate_content(content)
+        max_tokens = (self._COMPLETION_PARAMS["max_tokens"] + self._JSON_OVERHEAD_TOKENS) * count
+        # No stop sequence: the posts carry no signature, and the JSON must be
+        # allowed to run to its end
+        params = {key: value for key, value in self._COMPLETION_PARAMS.items() if key != "stop"}
+        params.update(max_tokens=max_tokens, stream=False, response_format={"type": "json_object"})
+        
+        async def request(target: _Endpoint) -> Any:
+            return await target.async_client.chat.completions.create(
+                model=target.deployment,
+                messages=[self._multi_system_message, {"role": "user", "content": content}],
+                **params
+            )
+        
+        completion = await self._with_retries_async(request, content, count)
+        
+        posts = {
+            int(item["id"]): item["post"]
+            for item in orjson.loads(completion.choices[0].message.content or "{}").get("posts", [])
+        }
+        missing = [i for i in range(1, count + 1) if not posts.get(i)]
+        if missing:
+            raise ValueError(f"No post generated for article(s) {missing}")
+        return [self._finalize_post(posts[i]) for i in range(1, count + 1)]
+    
+    def _estimate_tokens(self, content: str, completions: int = 1) -> int:
+        """
+        Estimate the quota cost of a request: prompt plus maximum completions.
+        
+        Args:
+            content (str): User content for the request
+            completions (int): Number of completions requested (n)
+            
+        Returns:
+            int: Estimated tokens charged against the TPM quota
+        """
+        prompt_chars = len(self.system_prompt) + len(content)
+        return prompt_chars // CHARS_PER_TOKEN + self._COMPLETION_PARAMS["max_tokens"] * completions
+    
+    def _throttle(self, target: _Endpoint, content: str, completions: int = 1):
+        """
+        Block until target's RPM and TPM limiters admit a request for content.
+        
+        Args:
+            target (_Endpoint): Endpoint the request is sent to
+            content (str): User content for the request
+            completions (int): Number of completions requested (n)
+        """
+        if target.rpm_bucket:
+            target.rpm_bucket.acquire()
+        if target.tpm_bucket:
+            target.tpm_bucket.acquire(self._estimate_tokens(content, completions))
+    
+    async def _throttle_async(self, target: _Endpoint, content: str, completions: int = 1):
+        """
+        Async version of _throttle.
+        
+        Args:
+            target (_Endpoint): Endpoint the request is sent to
+            content (str): User content for the request
+            completions (int): Number of posts the request produces
+        """
+        if target.rpm_bucket:
+            await target.rpm_bucket.acquire_async()
+        if target.tpm_bucket:
+            await target.tpm_bucket.acquire_async(self._estimate_tokens(content, completions))
+    
+    def _truncate_content(self, content: str) -> str:
+        """
+        Trim oversized input to the MAX_INPUT_TOKENS budget.
+        
+        Keeps the beginning and end of the content, where press release
+        headlines and the latest trending posts sit, and drops the middle.
+        
+        Args:
+            content (str): User content for the request
+            
+        Returns:
+            str: Content within the input budget
+        """
+        max_chars = MAX_INPUT_TOKENS * CHARS_PER_TOKEN
+        if len(content) <= max_chars:
+            return content
+        
+        half = max_chars // 2
+        logger.info("✂️  Trimming AI input from %d to %d characters", len(content), max_chars)
+        return f"{content[:half]}\n...\n{content[-half:]}"
+    
+    def _cache_key(self, content: str) -> str:
+        """
+        Hash everything that determines a completion into a cache key.
+        
+        Args:
+            content (str): User content for the request
+            
+        Returns:
+            str: Hex digest identifying the request
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.deployment, self.system_prompt, repr(self._COMPLETION_PARAMS), content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[str]:
+        """
+        Return a cached post for the key, marking it as recently used.
+        
+        Args:
+            key (str): Cache key from _cache_key
+            
+        Returns:
+            Optional[str]: The cached post, or None on a miss
+        """
+        post = self._response_cache.get(key)
+        if post is not None:
+            self._response_cache.move_to_end(key)
+            logger.info("♻️  Using cached social post for identical content")
+        return post
+    
+    def _cache_put(self, key: str, post: str):
+        """
+        Store a generated post, evicting the least recently used entry if full.
+        
+        Args:
+            key (str): Cache key from _cache_key
+            post (str): Generated post text
+        """
+        if self.cache_size <= 0:
+            return
+        self._response_cache[key] = post
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
+    
+    def _build_messages(self, content: str) -> List[Dict[str, Any]]:
+        """
+        Build the chat messages for a social post request.
+        
+        Args:
+            content (str): User content for the request
+            
+        Returns:
+            List[Dict[str, Any]]: System and user messages
+        """
+        return [
+            self._system_message,
+            {
+                "role": "user",
+                "content": content
+            }
+        ]
+    
+    def _finalize_post(self, generated_text: Optional[str]) -> str:
+        """
+        Validate generated text, append the signature and enforce the 255
+        character limit.
+        
+        Args:
+            generated_text (Optional[str]): Raw completion text, normally
+                                            ending just before the signature
+            
+        Returns:
+            str: Post text of 255 characters or less
+            
+        Raises:
+            ValueError: If no content was generated
+        """
+        # Drop the signature if the model wrote it without hitting the stop
+        body = (generated_text or "").partition(self._SIGNATURE_STOP)[0].strip()
+        if not body:
+            raise ValueError("No content generated from Azure OpenAI")
+        
+        # Ensure 255 character limit
+        if len(body) > self.MAX_BODY_CHARS:
+            body = f"{body[:self.MAX_BODY_CHARS - 3].rstrip()}..."
+            logger.debug("Generated text truncated to 255 characters")
+        
+        post = f"{body} {self.POST_SIGNATURE}"
+        logger.debug("Successfully generated social post: %d characters", len(post))
+        return post
     
     def diagnose_authentication_error(self) -> Dict[str, Any]:
         """
@@ -205,7 +935,7 @@ class VictorCampaignAzureOpenAI:
             "endpoint": self.endpoint,
             "deployment": self.deployment,
             "api_version": self.api_version,
-            "has_api_key": bool(os.getenv("AZURE_OPENAI_API_KEY")),
+            "has_api_key": bool(self._api_key),
             "endpoint_format_valid": False,
             "common_issues": [],
             "recommendations": []
@@ -219,13 +949,13 @@ class VictorCampaignAzureOpenAI:
             diagnostics["recommendations"].append("Check your Azure OpenAI resource endpoint URL")
         
         # Check API key if using key authentication
-        api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        api_key = self._api_key
         if api_key:
             if len(api_key) < 32:
                 diagnostics["common_issues"].append("API key appears too short")
                 diagnostics["recommendations"].append("Verify the API key is complete and valid")
             
-            if not api_key.replace("-", "").replace("_", "").isalnum():
+            if not _KEY_RE.match(api_key):
                 diagnostics["common_issues"].append("API key contains unexpected characters")
                 diagnostics["recommendations"].append("Ensure API key is copied correctly without extra spaces")
         
@@ -251,23 +981,10 @@ class VictorCampaignAzureOpenAI:
             test_content = "Test connection to Azure OpenAI for Victor Hawthorne campaign."
             
             messages = [
-                {
-                    "role": "system",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "You are a helpful assistant. Respond with 'Connection successful' if you receive this message."
-                        }
-                    ]
-                },
+                self._TEST_SYSTEM_MESSAGE,
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": test_content
-                        }
-                    ]
+                    "content": test_content
                 }
             ]
             
@@ -296,6 +1013,8 @@ def main():
     """
     Example usage and testing of the Azure OpenAI client.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("🤖 Victor Campaign Azure OpenAI Client Test")
     print("=" * 50)
     
@@ -346,8 +1065,8 @@ def main():
     except Exception as e:
         print(f"❌ Error: {e}")
         
-        # If it's a 401 error or similar authentication issue, provide diagnostics
-        if "401" in str(e) or "Access denied" in str(e) or "invalid subscription" in str(e):
+        # If it's a 401/403 authentication issue, provide diagnostics
+        if isinstance(e, AUTH_ERRORS):
             print("\n🔍 Running diagnostics for authentication error...")
             try:
                 client = VictorCampaignAzureOpenAI()
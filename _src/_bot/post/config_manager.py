@@ -14,14 +14,22 @@ Key Features:
 - Configuration file creation and template generation
 """
 
-import json
 import os
-from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+import sys
+import stat
+import logging
+import functools
+import orjson
+from typing import Dict, Any, Optional, Tuple, Set, ClassVar
+from dataclasses import dataclass, fields
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# __slots__ on the settings dataclasses where supported (Python 3.10+)
+_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTS)
 class BotCredentials:
     """Data class for bot authentication credentials."""
     username: str
@@ -30,7 +38,7 @@ class BotCredentials:
     display_name: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class TeamSettings:
     """Data class for team-related configuration."""
     team_invite_code: Optional[str] = None
@@ -41,7 +49,7 @@ class TeamSettings:
     member_email: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class APISettings:
     """Data class for API configuration."""
     base_url: str
@@ -50,7 +58,7 @@ class APISettings:
     retry_delay: float = 1.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class DatabaseSettings:
     """Data class for database configuration."""
     tokens_db: str = "./tokens.db"
@@ -58,6 +66,123 @@ class DatabaseSettings:
     teams_db: str = "./teams.db"
 
 
+# Field names of settings classes that are walked generically
+_CRED_FIELDS = tuple(f.name for f in fields(BotCredentials))
+_DB_FIELDS = tuple(f.name for f in fields(DatabaseSettings))
+
+# Team settings needed to register a new team
+_TEAM_CREATE_FIELDS = ("team_name", "affiliation", "member_name", "member_email")
+
+# Example configuration written by create_template_config, serialized once
+_TEMPLATE_CONFIG = {
+    "base_url": "https://social.legitreal.com/api",
+    "timeout": 30,
+    "retry_attempts": 3,
+    "retry_delay": 1.0,
+    "tokens_db": "./tokens.db",
+    "personas_db": "./personas.db",
+    "teams_db": "./teams.db",
+    "bot_credentials": {
+        "username": "your_bot_username",
+        "password": "your_bot_password",
+        "email": "your_bot@example.com",
+        "display_name": "Your Team Bot"
+    },
+    "team_invite_code": "your_team_invite_code_here",
+    "competition_bot_key": "your_competition_bot_key_here",
+    "team_name": "Your Team Name",
+    "affiliation": "Your University/Organization",
+    "member_name": "Team Lead Name",
+    "member_email": "teamlead@example.com"
+}
+_TEMPLATE_BYTES = orjson.dumps(_TEMPLATE_CONFIG, option=orjson.OPT_INDENT_2)
+
+# ConfigurationManager attributes holding the settings objects
+_SECTIONS = ("api_settings", "database_settings", "bot_credentials", "team_settings")
+
+# config.json shipped next to the bot scripts, one of the search locations
+_BOT_DIR = os.path.dirname(os.path.abspath(__file__))
+_BOT_DIR_CONFIG = os.path.join(_BOT_DIR, "config.json")
+
+# Environment variables that override configuration file values,
+# as (field name, environment variable) pairs
+_CRED_ENV = (
+    ("username", "TWOOTER_USERNAME"),
+    ("password", "TWOOTER_PASSWORD"),
+    ("email", "TWOOTER_EMAIL"),
+    ("display_name", "TWOOTER_DISPLAY_NAME"),
+)
+_TEAM_ENV = (
+    ("team_invite_code", "TWOOTER_TEAM_INVITE_CODE"),
+    ("competition_bot_key", "TWOOTER_COMPETITION_BOT_KEY"),
+)
+_OVERRIDE_VARS = tuple(var for _, var in _CRED_ENV + _TEAM_ENV)
+
+
+def _stat_file(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a path, returning the result only if it is a regular file.
+    
+    Args:
+        path (str): Path to check
+        
+    Returns:
+        Optional[os.stat_result]: Stat result, or None if not a regular file
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_db_path(db_path: str, config_dir: str) -> str:
+    """
+    Resolve database file path relative to configuration directory.
+    
+    Results are cached, as the same few paths are resolved on every load.
+    
+    Args:
+        db_path (str): Database path from configuration
+        config_dir (str): Configuration file directory
+        
+    Returns:
+        str: Resolved absolute database path
+    """
+    return os.path.realpath(os.path.join(config_dir, db_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_parsed(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Read and parse a configuration file.
+    
+    Results are cached per path and modification time, so loading an
+    unchanged file again skips the read and parse, while an edited file gets
+    a new mtime and is parsed afresh. The returned dict is shared between
+    callers and must not be modified.
+    
+    Args:
+        path (str): Configuration file path
+        mtime_ns (int): File modification time, part of the cache key
+        size (int): File size in bytes, from the same stat
+        
+    Returns:
+        Dict[str, Any]: Parsed configuration data
+    """
+    # Config files are small: read them in one call on a raw descriptor
+    # and let orjson parse the UTF-8 bytes directly. A full parse of a
+    # document this size is cheaper than setting up a lazy/streaming parser,
+    # and the result is cached anyway
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return orjson.loads(data)
+
+
 class ConfigurationManager:
     """
     Manages configuration for team bots including credentials, team settings,
@@ -68,6 +193,9 @@ class ConfigurationManager:
     local configuration files and environment variable overrides.
     """
     
+    # Database directories this process has already created or found
+    _ensured_dirs: ClassVar[Set[str]] = set()
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the configuration manager.
@@ -77,22 +205,22 @@ class ConfigurationManager:
                                        If None, will search for config.json
                                        in current directory and standard locations.
         """
-        self.config_path = self._resolve_config_path(config_path)
+        # The stat taken while resolving the path is reused by load_config
+        self.config_path, self._config_stat = self._resolve_config_path(config_path)
         self.config_data = {}
+        self._env: Dict[str, Optional[str]] = {}
         
-        # Configuration sections
-        self.bot_credentials: Optional[BotCredentials] = None
-        self.team_settings: Optional[TeamSettings] = None
-        self.api_settings: Optional[APISettings] = None
-        self.database_settings: Optional[DatabaseSettings] = None
+        # Configuration sections (bot_credentials, team_settings, api_settings,
+        # database_settings) are built from config_data on first access
         
         # Load configuration if file exists
-        if self.config_path and Path(self.config_path).exists():
+        if self._config_stat is not None:
             self.load_config()
         else:
             self._create_default_config()
     
-    def _resolve_config_path(self, explicit_path: Optional[str]) -> Optional[str]:
+    @staticmethod
+    def _resolve_config_path(explicit_path: Optional[str]) -> Tuple[str, Optional[os.stat_result]]:
         """
         Resolve the configuration file path using multiple search strategies.
         
@@ -106,31 +234,36 @@ class ConfigurationManager:
             explicit_path (Optional[str]): Explicitly provided config path
             
         Returns:
-            Optional[str]: Resolved config file path or None if not found
+            Tuple[str, Optional[os.stat_result]]: Resolved config file path and
+                                                  its stat result, or None if
+                                                  no such file exists
         """
         # 1. Use explicit path if provided
         if explicit_path:
-            return str(Path(explicit_path).expanduser().resolve())
+            path = os.path.realpath(os.path.expanduser(explicit_path))
+            return path, _stat_file(path)
         
         # 2. Check current working directory
-        cwd_config = Path.cwd() / "config.json"
-        if cwd_config.is_file():
-            return str(cwd_config.resolve())
+        cwd_config = os.path.join(os.getcwd(), "config.json")
+        st = _stat_file(cwd_config)
+        if st is not None:
+            return os.path.realpath(cwd_config), st
         
         # 3. Check bot directory
-        bot_dir_config = Path(__file__).parent / "config.json"
-        if bot_dir_config.is_file():
-            return str(bot_dir_config.resolve())
+        st = _stat_file(_BOT_DIR_CONFIG)
+        if st is not None:
+            return os.path.realpath(_BOT_DIR_CONFIG), st
         
         # 4. Check environment variable
         env_config = os.getenv('TWOOTER_CONFIG')
         if env_config:
-            env_path = Path(env_config).expanduser()
-            if env_path.is_file():
-                return str(env_path.resolve())
+            env_path = os.path.expanduser(env_config)
+            st = _stat_file(env_path)
+            if st is not None:
+                return os.path.realpath(env_path), st
         
         # 5. Default location in current directory
-        return str(Path.cwd() / "config.json")
+        return cwd_config, None
     
     def _create_default_config(self):
         """
@@ -139,8 +272,8 @@ class ConfigurationManager:
         This method sets up default values for all configuration sections
         when no configuration file is found.
         """
-        print("⚠️  No configuration file found. Using default settings.")
-        print(f"📄 You can create a config file at: {self.config_path}")
+        logger.warning("⚠️  No configuration file found. Using default settings.")
+        logger.warning("📄 You can create a config file at: %s", self.config_path)
         
         # Set default values
         self.api_settings = APISettings(
@@ -165,116 +298,114 @@ class ConfigurationManager:
             ValueError: If configuration file contains invalid JSON
             KeyError: If required configuration keys are missing
         """
-        if not self.config_path or not Path(self.config_path).exists():
+        # Use the stat from path resolution once; later reloads stat afresh
+        st, self._config_stat = self._config_stat, None
+        if st is None and self.config_path:
+            st = _stat_file(self.config_path)
+        if st is None:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config_data = json.load(f)
-            
-            print(f"✅ Loaded configuration from: {self.config_path}")
+            self.config_data = _load_parsed(self.config_path, st.st_mtime_ns, st.st_size)
             
-            # Load API settings
-            self._load_api_settings()
+            if not self.config_data.get('base_url'):
+                raise KeyError("Missing required 'base_url' in configuration")
             
-            # Load database settings
-            self._load_database_settings()
+            logger.info("✅ Loaded configuration from: %s", self.config_path)
             
-            # Load bot credentials
-            self._load_bot_credentials()
+            # Snapshot the override variables now, so sections built later
+            # reflect the environment as it was at load time
+            environ = os.environ
+            self._env = {var: environ.get(var) for var in _OVERRIDE_VARS}
             
-            # Load team settings
-            self._load_team_settings()
+            # Drop sections built from previously loaded data
+            for section in _SECTIONS:
+                self.__dict__.pop(section, None)
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
         except Exception as e:
             raise Exception(f"Error loading configuration: {e}")
     
-    def _load_api_settings(self):
+    @functools.cached_property
+    def api_settings(self) -> Optional[APISettings]:
+        """API configuration settings, loaded on first access."""
+        return self._load_api_settings()
+    
+    @functools.cached_property
+    def database_settings(self) -> Optional[DatabaseSettings]:
+        """Database configuration settings, loaded on first access."""
+        return self._load_database_settings()
+    
+    @functools.cached_property
+    def bot_credentials(self) -> Optional[BotCredentials]:
+        """Bot credentials, loaded on first access; None if incomplete."""
+        return self._load_bot_credentials(self._env)
+    
+    @functools.cached_property
+    def team_settings(self) -> Optional[TeamSettings]:
+        """Team-related settings, loaded on first access."""
+        return self._load_team_settings(self._env)
+    
+    def _load_api_settings(self) -> APISettings:
         """Load API configuration settings."""
-        base_url = self.config_data.get('base_url')
-        if not base_url:
-            raise KeyError("Missing required 'base_url' in configuration")
-        
-        self.api_settings = APISettings(
-            base_url=base_url.rstrip('/'),
+        return APISettings(
+            base_url=self.config_data['base_url'].rstrip('/'),
             timeout=self.config_data.get('timeout', 30),
             retry_attempts=self.config_data.get('retry_attempts', 3),
             retry_delay=self.config_data.get('retry_delay', 1.0)
         )
     
-    def _load_database_settings(self):
+    def _load_database_settings(self) -> DatabaseSettings:
         """Load database configuration settings."""
-        config_dir = Path(self.config_path).parent if self.config_path else Path.cwd()
+        config_dir = os.path.dirname(self.config_path) if self.config_path else os.getcwd()
         
-        self.database_settings = DatabaseSettings(
-            tokens_db=self._resolve_db_path(
+        settings = DatabaseSettings(
+            tokens_db=_resolve_db_path(
                 self.config_data.get('tokens_db', './tokens.db'), config_dir
             ),
-            personas_db=self._resolve_db_path(
+            personas_db=_resolve_db_path(
                 self.config_data.get('personas_db', './personas.db'), config_dir
             ),
-            teams_db=self._resolve_db_path(
+            teams_db=_resolve_db_path(
                 self.config_data.get('teams_db', './teams.db'), config_dir
             )
         )
-    
-    def _resolve_db_path(self, db_path: str, config_dir: Path) -> str:
-        """
-        Resolve database file path relative to configuration directory.
-        
-        Args:
-            db_path (str): Database path from configuration
-            config_dir (Path): Configuration file directory
-            
-        Returns:
-            str: Resolved absolute database path
-        """
-        path = Path(db_path)
-        if not path.is_absolute():
-            path = config_dir / path
         
-        # Create parent directories if they don't exist
-        path.parent.mkdir(parents=True, exist_ok=True)
+        # Create parent directories if they don't exist; the databases usually
+        # share one directory, and each is checked once per process
+        for directory in {os.path.dirname(getattr(settings, f)) for f in _DB_FIELDS}:
+            if directory not in self._ensured_dirs:
+                if not os.path.isdir(directory):
+                    os.makedirs(directory, exist_ok=True)
+                self._ensured_dirs.add(directory)
         
-        return str(path.resolve())
+        return settings
     
-    def _load_bot_credentials(self):
-        """Load bot credential settings."""
+    def _load_bot_credentials(self, env: Dict[str, Optional[str]]) -> Optional[BotCredentials]:
+        """Load bot credential settings, with overrides from the env snapshot."""
         creds = self.config_data.get('bot_credentials', {})
         
         # Allow environment variable overrides
-        username = os.getenv('TWOOTER_USERNAME') or creds.get('username')
-        password = os.getenv('TWOOTER_PASSWORD') or creds.get('password')
-        email = os.getenv('TWOOTER_EMAIL') or creds.get('email')
-        display_name = os.getenv('TWOOTER_DISPLAY_NAME') or creds.get('display_name')
-        
-        if username and password and email and display_name:
-            self.bot_credentials = BotCredentials(
-                username=username,
-                password=password,
-                email=email,
-                display_name=display_name
-            )
-        else:
-            print("⚠️  Bot credentials not fully configured. Some may be missing:")
-            print(f"   Username: {'✓' if username else '✗'}")
-            print(f"   Password: {'✓' if password else '✗'}")
-            print(f"   Email: {'✓' if email else '✗'}")
-            print(f"   Display Name: {'✓' if display_name else '✗'}")
+        values = {field: env.get(var) or creds.get(field) for field, var in _CRED_ENV}
+        
+        if all(values.values()):
+            return BotCredentials(**values)
+        
+        logger.warning(
+            "⚠️  Bot credentials not fully configured. Some may be missing:\n"
+            "   Username: %s\n   Password: %s\n   Email: %s\n   Display Name: %s",
+            *('✓' if values[f] else '✗' for f in _CRED_FIELDS)
+        )
+        return None
     
-    def _load_team_settings(self):
-        """Load team-related settings."""
+    def _load_team_settings(self, env: Dict[str, Optional[str]]) -> TeamSettings:
+        """Load team-related settings, with overrides from the env snapshot."""
         # Allow environment variable overrides
-        team_invite_code = (os.getenv('TWOOTER_TEAM_INVITE_CODE') or 
-                           self.config_data.get('team_invite_code'))
-        competition_bot_key = (os.getenv('TWOOTER_COMPETITION_BOT_KEY') or 
-                              self.config_data.get('competition_bot_key'))
-        
-        self.team_settings = TeamSettings(
-            team_invite_code=team_invite_code,
-            competition_bot_key=competition_bot_key,
+        values = {field: env.get(var) or self.config_data.get(field) for field, var in _TEAM_ENV}
+        
+        return TeamSettings(
+            **values,
             team_name=self.config_data.get('team_name'),
             affiliation=self.config_data.get('affiliation'),
             member_name=self.config_data.get('member_name'),
@@ -294,45 +425,85 @@ class ConfigurationManager:
         if not self.config_path:
             raise Exception("No configuration path specified")
         
-        config_path = Path(self.config_path)
-        
-        # Create backup if requested and file exists
-        if backup and config_path.exists():
-            backup_path = config_path.with_suffix('.json.backup')
-            config_path.rename(backup_path)
-            print(f"📁 Created backup: {backup_path}")
-        
-        # Build configuration dictionary
-        config_dict = {}
-        
-        if self.api_settings:
-            config_dict.update(asdict(self.api_settings))
-        
-        if self.database_settings:
-            db_dict = asdict(self.database_settings)
-            config_dict.update(db_dict)
-        
-        if self.bot_credentials:
-            config_dict['bot_credentials'] = asdict(self.bot_credentials)
-        
-        if self.team_settings:
-            team_dict = asdict(self.team_settings)
-            # Remove None values
-            team_dict = {k: v for k, v in team_dict.items() if v is not None}
-            config_dict.update(team_dict)
+        config_path = self.config_path
+        stem = os.path.splitext(config_path)[0]
+        tmp_path = stem + '.json.tmp'
         
         try:
             # Ensure parent directory exists
-            config_path.parent.mkdir(parents=True, exist_ok=True)
+            os.makedirs(os.path.dirname(config_path) or '.', exist_ok=True)
+            
+            # Write a temporary file and swap it in, so a failed save never
+            # leaves the configuration missing or half-written
+            with open(tmp_path, 'wb') as f:
+                f.write(self._serialize())
+                f.flush()
+                os.fsync(f.fileno())
             
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            # Create backup if requested and file exists
+            if backup and os.path.exists(config_path):
+                backup_path = stem + '.json.backup'
+                os.replace(config_path, backup_path)
+                logger.info("📁 Created backup: %s", backup_path)
             
-            print(f"✅ Configuration saved to: {config_path}")
+            os.replace(tmp_path, config_path)
+            logger.info("✅ Configuration saved to: %s", config_path)
             
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
             raise Exception(f"Failed to save configuration: {e}")
     
+    def _serialize(self) -> bytes:
+        """
+        Serialize the current settings in the configuration file layout.
+        
+        The file schema is fixed, so keys are written directly in file order
+        rather than merged from per-section dicts.
+        
+        Returns:
+            bytes: Indented JSON document
+        """
+        config_dict: Dict[str, Any] = {}
+        
+        api = self.api_settings
+        if api:
+            config_dict['base_url'] = api.base_url
+            config_dict['timeout'] = api.timeout
+            config_dict['retry_attempts'] = api.retry_attempts
+            config_dict['retry_delay'] = api.retry_delay
+        
+        db = self.database_settings
+        if db:
+            config_dict['tokens_db'] = db.tokens_db
+            config_dict['personas_db'] = db.personas_db
+            config_dict['teams_db'] = db.teams_db
+        
+        creds = self.bot_credentials
+        if creds:
+            config_dict['bot_credentials'] = {
+                'username': creds.username,
+                'password': creds.password,
+                'email': creds.email,
+                'display_name': creds.display_name
+            }
+        
+        team = self.team_settings
+        if team:
+            # Remove None values
+            for key, value in (('team_invite_code', team.team_invite_code),
+                               ('competition_bot_key', team.competition_bot_key),
+                               ('team_name', team.team_name),
+                               ('affiliation', team.affiliation),
+                               ('member_name', team.member_name),
+                               ('member_email', team.member_email)):
+                if value is not None:
+                    config_dict[key] = value
+        
+        return orjson.dumps(config_dict, option=orjson.OPT_INDENT_2)
+    
     def create_template_config(self, output_path: Optional[str] = None):
         """
         Create a template configuration file with example values.
@@ -343,37 +514,15 @@ class ConfigurationManager:
         """
         template_path = output_path or self.config_path or "config.json"
         
-        template_config = {
-            "base_url": "https://social.legitreal.com/api",
-            "timeout": 30,
-            "retry_attempts": 3,
-            "retry_delay": 1.0,
-            "tokens_db": "./tokens.db",
-            "personas_db": "./personas.db",
-            "teams_db": "./teams.db",
-            "bot_credentials": {
-                "username": "your_bot_username",
-                "password": "your_bot_password",
-                "email": "your_bot@example.com",
-                "display_name": "Your Team Bot"
-            },
-            "team_invite_code": "your_team_invite_code_here",
-            "competition_bot_key": "your_competition_bot_key_here",
-            "team_name": "Your Team Name",
-            "affiliation": "Your University/Organization",
-            "member_name": "Team Lead Name",
-            "member_email": "teamlead@example.com"
-        }
-        
         try:
-            with open(template_path, 'w', encoding='utf-8') as f:
-                json.dump(template_config, f, indent=2, ensure_ascii=False)
+            with open(template_path, 'wb') as f:
+                f.write(_TEMPLATE_BYTES)
             
-            print(f"📄 Template configuration created: {template_path}")
-            print("✏️  Please edit the template with your actual values before using.")
+            logger.info("📄 Template configuration created: %s", template_path)
+            logger.info("✏️  Please edit the template with your actual values before using.")
             
         except Exception as e:
-            print(f"❌ Failed to create template: {e}")
+            logger.error("❌ Failed to create template: %s", e)
     
     def validate_config(self) -> Dict[str, bool]:
         """
@@ -396,82 +545,79 @@ class ConfigurationManager:
         )
         
         # Validate bot credentials
+        creds = self.bot_credentials
         validation_results['bot_credentials'] = (
-            self.bot_credentials is not None and
-            all([
-                self.bot_credentials.username,
-                self.bot_credentials.password,
-                self.bot_credentials.email,
-                self.bot_credentials.display_name
-            ])
+            creds is not None and
+            all(getattr(creds, f) for f in _CRED_FIELDS)
         )
         
         # Validate team settings (at least one method should be available)
+        team = self.team_settings
         validation_results['team_settings'] = (
-            self.team_settings is not None and
-            any([
-                self.team_settings.team_invite_code,
-                self.team_settings.competition_bot_key,
-                all([
-                    self.team_settings.team_name,
-                    self.team_settings.affiliation,
-                    self.team_settings.member_name,
-                    self.team_settings.member_email
-                ])
-            ])
+            team is not None and (
+                bool(team.team_invite_code) or
+                bool(team.competition_bot_key) or
+                all(getattr(team, f) for f in _TEAM_CREATE_FIELDS)
+            )
         )
         
         return validation_results
     
     def print_config_status(self):
         """Print the current configuration status."""
-        print("\n📋 Configuration Status:")
-        print("=" * 50)
+        # Collect the report and write it in one go
+        lines = []
+        add = lines.append
+        
+        add("\n📋 Configuration Status:")
+        add("=" * 50)
         
         if self.config_path:
-            print(f"📁 Config file: {self.config_path}")
+            add(f"📁 Config file: {self.config_path}")
         else:
-            print("📁 Config file: Not set (using defaults)")
+            add("📁 Config file: Not set (using defaults)")
         
         validation = self.validate_config()
         
-        print(f"\n🔧 API Settings: {'✅' if validation['api_settings'] else '❌'}")
+        add(f"\n🔧 API Settings: {'✅' if validation['api_settings'] else '❌'}")
         if self.api_settings:
-            print(f"   Base URL: {self.api_settings.base_url}")
-            print(f"   Timeout: {self.api_settings.timeout}s")
+            add(f"   Base URL: {self.api_settings.base_url}")
+            add(f"   Timeout: {self.api_settings.timeout}s")
         
-        print(f"\n💾 Database Settings: {'✅' if validation['database_settings'] else '❌'}")
+        add(f"\n💾 Database Settings: {'✅' if validation['database_settings'] else '❌'}")
         if self.database_settings:
-            print(f"   Tokens DB: {self.database_settings.tokens_db}")
-            print(f"   Personas DB: {self.database_settings.personas_db}")
-            print(f"   Teams DB: {self.database_settings.teams_db}")
+            add(f"   Tokens DB: {self.database_settings.tokens_db}")
+            add(f"   Personas DB: {self.database_settings.personas_db}")
+            add(f"   Teams DB: {self.database_settings.teams_db}")
         
-        print(f"\n🤖 Bot Credentials: {'✅' if validation['bot_credentials'] else '❌'}")
+        add(f"\n🤖 Bot Credentials: {'✅' if validation['bot_credentials'] else '❌'}")
         if self.bot_credentials:
-            print(f"   Username: {self.bot_credentials.username}")
-            print(f"   Display Name: {self.bot_credentials.display_name}")
-            print(f"   Email: {self.bot_credentials.email}")
-            print("   Password: [CONFIGURED]")
+            add(f"   Username: {self.bot_credentials.username}")
+            add(f"   Display Name: {self.bot_credentials.display_name}")
+            add(f"   Email: {self.bot_credentials.email}")
+            add("   Password: [CONFIGURED]")
         
-        print(f"\n👥 Team Settings: {'✅' if validation['team_settings'] else '❌'}")
+        add(f"\n👥 Team Settings: {'✅' if validation['team_settings'] else '❌'}")
         if self.team_settings:
             if self.team_settings.team_invite_code:
-                print("   Team Invite Code: [CONFIGURED]")
+                add("   Team Invite Code: [CONFIGURED]")
             if self.team_settings.competition_bot_key:
-                print("   Competition Bot Key: [CONFIGURED]")
+                add("   Competition Bot Key: [CONFIGURED]")
             if self.team_settings.team_name:
-                print(f"   Team Name: {self.team_settings.team_name}")
-                print(f"   Affiliation: {self.team_settings.affiliation}")
+                add(f"   Team Name: {self.team_settings.team_name}")
+                add(f"   Affiliation: {self.team_settings.affiliation}")
         
         all_valid = all(validation.values())
-        print(f"\n🎯 Overall Status: {'✅ Ready to run' if all_valid else '⚠️  Needs configuration'}")
+        add(f"\n🎯 Overall Status: {'✅ Ready to run' if all_valid else '⚠️  Needs configuration'}")
         
         if not all_valid:
-            print("\n💡 To fix configuration issues:")
+            add("\n💡 To fix configuration issues:")
             if not validation['bot_credentials']:
-                print("   - Set bot credentials in config.json or environment variables")
+                add("   - Set bot credentials in config.json or environment variables")
             if not validation['team_settings']:
-                print("   - Provide team_invite_code, competition_bot_key, or team creation info")
+                add("   - Provide team_invite_code, competition_bot_key, or team creation info")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_team_info_for_registration(self) -> Optional[Dict[str, str]]:
         """
@@ -480,20 +626,12 @@ class ConfigurationManager:
         Returns:
             Optional[Dict[str, str]]: Team info dict or None if not configured
         """
-        if not self.team_settings:
+        team = self.team_settings
+        if not team:
             return None
         
-        if all([
-            self.team_settings.team_name,
-            self.team_settings.affiliation,
-            self.team_settings.member_name,
-            self.team_settings.member_email
-        ]):
-            return {
-                'team_name': self.team_settings.team_name,
-                'affiliation': self.team_settings.affiliation,
-                'member_name': self.team_settings.member_name,
-                'member_email': self.team_settings.member_email
-            }
+        info = {f: getattr(team, f) for f in _TEAM_CREATE_FIELDS}
+        if all(info.values()):
+            return info
         
         return None
\ No newline at end of file
@@ -18,15 +18,76 @@ Returns data in the specified JSON format:
 }
 """
 
-import json
-import time
+import functools
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# The index links and navigation hrefs are the same on every crawl, so joined
+# URLs are memoized for the life of the process
+_urljoin = functools.lru_cache(maxsize=4096)(urljoin)
+
+# Upper bound on the decoded HTML read from any one page. Article pages are
+# a few tens of KB; anything past this is truncated rather than buffered
+MAX_RESPONSE_BYTES = 1_500_000
+
+# Articles whose bodies share more than DUPLICATE_THRESHOLD of their
+# SHINGLE_SIZE-word shingles (Jaccard) are treated as the same article
+SHINGLE_SIZE = 13
+DUPLICATE_THRESHOLD = 0.8
+
+# Stop gathering sibling text after the main heading once this much has been
+# collected; the AI client trims its input to about 6000 characters anyway
+MAX_SIBLING_CONTENT_CHARS = 6000
+CONTENT_TAGS = frozenset(('p', 'div', 'section', 'article'))
+
+# Link-classification patterns, all lowercase so they can be matched against
+# a lowercased URL or link text. Each list is fused into one alternation so a
+# URL is scanned once per list rather than once per pattern
+SKIP_PATTERNS = (
+    'javascript:', 'mailto:', '#', '.css', '.js', '.jpg', '.png',
+    '.gif', '.pdf', '.ico', '.svg', 'contact', 'about', 'privacy',
+    'terms', 'policies.html', 'authors-list.html'
+)
+NEWS_PRESS_KEYWORDS = (
+    'news', 'press', 'release', 'article', 'story', 'update',
+    'announcement', 'statement', 'kingston', 'victor', 'campaign',
+    'beyond', 'future', 'vision', 'building', 'people'
+)
+NEWS_PRESS_URL_PATTERNS = (
+    '/post/', '/news/', '/press/', '/article/', '/story/',
+    '/release/', '/2025-', 'kingston', 'beyond', 'future'
+)
+ARTICLE_URL_PATTERNS = (
+    '/post/', '/news/', '/press/', '/article/', '/story/',
+    '/release/', '/update/', '/announcement/'
+)
+SKIP_RE = re.compile('|'.join(map(re.escape, SKIP_PATTERNS)))
+NEWS_PRESS_KEYWORDS_RE = re.compile('|'.join(map(re.escape, NEWS_PRESS_KEYWORDS)))
+NEWS_PRESS_URL_RE = re.compile('|'.join(map(re.escape, NEWS_PRESS_URL_PATTERNS)))
+ARTICLE_URL_RE = re.compile('|'.join(map(re.escape, ARTICLE_URL_PATTERNS)))
+
+# Article pages only need the tags the title/content/summary extractors look
+# at; everything else (scripts, images, SVG, comments) is skipped at parse time.
+# Page chrome is kept so _extract_content can still remove it with its contents
+ARTICLE_STRAINER = SoupStrainer(
+    ['title', 'h1', 'h2', 'h3', 'article', 'main', 'section', 'div', 'p', 'meta',
+     'header', 'nav', 'footer', 'aside']
+)
 
 
 class NewsPressCrawler:
@@ -34,7 +95,48 @@ class NewsPressCrawler:
     Focused crawler for Victor campaign News and Press Releases.
     """
     
-    def __init__(self):
+    # Content clean-up patterns, compiled once. The navigation boilerplate
+    # patterns are fused into one alternation so the text is scanned once
+    _WS_NEWLINES = re.compile(r'\n{3,}')
+    _WS_SPACES = re.compile(r' {2,}')
+    _NAV_PATTERNS = (
+        r'Home.*?Contact',
+        r'Skip to.*?content',
+        r'Navigation.*?menu',
+        r'Search.*?site',
+        r'Copyright.*?\d{4}',
+        r'All rights reserved',
+        r'Privacy.*?Policy',
+        r'Terms.*?Service'
+    )
+    _NAV_RE = re.compile('|'.join(f'(?:{p})' for p in _NAV_PATTERNS),
+                         re.IGNORECASE | re.DOTALL)
+    
+    # Extractor selectors in priority order: each is tried in turn, so an
+    # <h1> beats an earlier <h2> and an <article> beats its <main> wrapper
+    TITLE_SELECTORS = ('h1', 'h2', '.title', '.headline', '.article-title', '.post-title')
+    CONTENT_SELECTORS = (
+        'article',
+        '[role="main"]',
+        '.content',
+        '.article-content',
+        '.post-content',
+        '.main-content',
+        'main',
+        '.entry-content',
+        '.article-body',
+        '.post-body'
+    )
+    SUMMARY_SELECTORS = ('.summary', '.excerpt', '.lead', '.intro',
+                         '.description', '.abstract', '.preview')
+    
+    def __init__(self, max_workers: int = 8):
+        """
+        Initialize the crawler.
+        
+        Args:
+            max_workers: Number of article pages fetched concurrently
+        """
         self.base_url = "https://victor-for-president.legitreal.com"
         self.index_url = f"{self.base_url}/index.html"
         self.session = requests.Session()
@@ -42,11 +144,37 @@ class NewsPressCrawler:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # Includes br when brotli is installed, so urllib3 can decode it
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        
+        # Article pages are fetched from a thread pool; size the connection
+        # pool so every worker keeps its connection alive, and let urllib3
+        # retry transient server errors (and honour Retry-After on 429)
+        self.max_workers = max_workers
+        pool_size = max(max_workers, 16)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         self.processed_urls: Set[str] = set()
+        self._processed_lock = threading.Lock()
+        
+        # Validators (ETag / Last-Modified) and extracted results of pages
+        # seen by earlier crawls, keyed by URL. Repeated crawls revalidate
+        # with a conditional GET and reuse the result on 304 Not Modified
+        self._page_cache: Dict[str, Tuple[Dict[str, str], Any]] = {}
     
     def crawl_news_and_press(self) -> Dict:
         """
@@ -55,8 +183,8 @@ class NewsPressCrawler:
         Returns:
             Dict: Data in the specified format with main array
         """
-        print("🚀 Starting News and Press Releases crawler...")
-        print(f"🔍 Scanning: {self.index_url}")
+        logger.info("🚀 Starting News and Press Releases crawler...")
+        logger.info("🔍 Scanning: %s", self.index_url)
         
         # Clear processed URLs to allow re-crawling in loop scenarios
         self.processed_urls.clear()
@@ -73,49 +201,175 @@ class NewsPressCrawler:
         
         try:
             # Step 1: Get the main index page
-            print("📖 Loading main page...")
-            response = self.session.get(self.index_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Step 2: Find News and Press Release links
-            article_links = self._find_news_press_links(soup)
-            print(f"🔗 Found {len(article_links)} News/Press Release links")
+            logger.info("📖 Loading main page...")
+            with self.session.get(self.index_url, timeout=15, stream=True,
+                                  headers=self._revalidation_headers(self.index_url)) as response:
+                response.raise_for_status()
+                
+                # Step 2: Find News and Press Release links
+                if response.status_code == 304:
+                    logger.info("   ♻️  Main page not modified, reusing links")
+                    article_links = list(self._page_cache[self.index_url][1])
+                else:
+                    soup = self._parse_html(response)
+                    article_links = self._find_news_press_links(soup)
+                    self._remember_page(self.index_url, response, article_links)
+            logger.info("🔗 Found %d News/Press Release links", len(article_links))
             
-            # Step 3: Process each article
-            for i, article_url in enumerate(article_links, 1):
-                try:
-                    print(f"📰 Processing article {i}/{len(article_links)}: {article_url}")
-                    article_data = self._extract_article_details(article_url)
+            # Step 3: Process the articles concurrently; each one is dominated
+            # by network I/O, and the pool size bounds the load on the site
+            articles: List[Optional[Dict]] = [None] * len(article_links)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self._extract_article_details, article_url): i
+                    for i, article_url in enumerate(article_links)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    article_url = article_links[i]
+                    logger.debug("📰 Processed article %d/%d: %s", done, len(article_links), article_url)
+                    try:
+                        article_data = future.result()
+                    except Exception as e:
+                        logger.warning("   ❌ Error processing %s: %s", article_url, e)
+                        continue
                     
                     if article_data:
-                        result["main"].append(article_data)
-                        print(f"   ✅ Extracted: {article_data['title'][:50]}...")
+                        articles[i] = article_data
+                        logger.debug("   ✅ Extracted: %.50s...", article_data['title'])
                     else:
-                        print(f"   ❌ Failed to extract content")
-                    
-                    # Rate limiting
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    print(f"   ❌ Error processing {article_url}: {e}")
+                        logger.debug("   ❌ Failed to extract content")
+            
+            # Keep the articles in link order, dropping bodies the CMS
+            # serves again under a different URL
+            seen_shingles: List[Set[int]] = []
+            for article in articles:
+                if not article:
                     continue
+                shingles = self._content_shingles(article["content"])
+                if any(self._jaccard(shingles, prior) > DUPLICATE_THRESHOLD
+                       for prior in seen_shingles):
+                    logger.info("   ⏭️  Skipping duplicate article: %.50s...", article['title'])
+                    continue
+                seen_shingles.append(shingles)
+                result["main"].append(article)
             
             # Update metadata
             result["metadata"]["total_articles"] = len(result["main"])
             result["metadata"]["completion_time"] = datetime.now().isoformat()
             
-            print(f"\n✅ Crawling completed!")
-            print(f"📊 Total articles extracted: {len(result['main'])}")
+            logger.info("✅ Crawling completed!")
+            logger.info("📊 Total articles extracted: %d", len(result['main']))
             
             return result
             
         except Exception as e:
-            print(f"❌ Fatal error during crawling: {e}")
+            logger.error("❌ Fatal error during crawling: %s", e)
             result["metadata"]["error"] = str(e)
             return result
     
+    def _revalidation_headers(self, url: str) -> Dict[str, str]:
+        """
+        Conditional request headers for a page fetched by an earlier crawl.
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers, or an
+            empty dict if the page has not been cached
+        """
+        cached = self._page_cache.get(url)
+        return cached[0] if cached else {}
+    
+    def _remember_page(self, url: str, response: requests.Response, value: Any):
+        """
+        Cache the result of a page along with its validators.
+        
+        Pages served without an ETag or Last-Modified header can't be
+        revalidated, so they are not cached.
+        
+        Args:
+            url: Page URL
+            response: Response the value was extracted from
+            value: Extracted result to reuse while the page is unchanged
+        """
+        validators = {}
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['If-None-Match'] = etag
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+        
+        if validators:
+            self._page_cache[url] = (validators, value)
+        else:
+            self._page_cache.pop(url, None)
+    
+    @staticmethod
+    def _content_shingles(content: str, size: int = SHINGLE_SIZE) -> Set[int]:
+        """
+        Hash the overlapping word n-grams of an article body.
+        
+        Args:
+            content: Cleaned article content
+            size: Words per shingle
+            
+        Returns:
+            Set[int]: Hashes of every size-word window; empty for empty
+                      content, so it never counts as a duplicate
+        """
+        tokens = content.lower().split()
+        if not tokens:
+            return set()
+        if len(tokens) <= size:
+            return {hash(tuple(tokens))}
+        return {hash(tuple(tokens[i:i + size]))
+                for i in range(len(tokens) - size + 1)}
+    
+    @staticmethod
+    def _jaccard(a: Set[int], b: Set[int]) -> float:
+        """
+        Jaccard similarity of two shingle sets.
+        
+        Args:
+            a: First shingle set
+            b: Second shingle set
+            
+        Returns:
+            float: Size of the intersection over size of the union
+        """
+        if not a or not b:
+            return 0.0
+        overlap = len(a & b)
+        return overlap / (len(a) + len(b) - overlap)
+    
+    def _parse_html(self, response: requests.Response,
+                    parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Parse a fetched page with the C-based lxml parser.
+        
+        The body is read from the stream and capped at MAX_RESPONSE_BYTES, and
+        handed to lxml as bytes with an explicit encoding so BeautifulSoup
+        never has to detect it: the Content-Type charset if declared, UTF-8
+        otherwise (the campaign site serves UTF-8; requests would assume
+        ISO-8859-1 for text/html without a charset).
+        
+        Args:
+            response: Streamed response for an HTML page
+            parse_only: Optional strainer limiting which tags are built
+            
+        Returns:
+            BeautifulSoup: Parsed page
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if 'charset=' not in content_type.lower():
+            response.encoding = 'utf-8'
+        body = response.raw.read(MAX_RESPONSE_BYTES, decode_content=True)
+        return BeautifulSoup(body, 'lxml', from_encoding=response.encoding,
+                             parse_only=parse_only)
+    
     def _find_news_press_links(self, soup: BeautifulSoup) -> List[str]:
         """
         Find all News and Press Release links from the main page.
@@ -128,55 +382,26 @@ class NewsPressCrawler:
         """
         article_links = set()
         
-        # Strategy 1: Look for links in articles, posts, or news sections
-        news_indicators = [
-            'article', 'post', 'news', 'press', 'content', 'item',
-            'story', 'release', 'update', 'announcement'
-        ]
-        
-        # Find elements that likely contain news/press links
-        for element in soup.find_all(['article', 'div', 'section'], class_=True):
-            classes = ' '.join(element.get('class', [])).lower()
-            
-            # Check if element classes suggest news/press content
-            if any(indicator in classes for indicator in news_indicators):
-                # Find all links within this element
-                for link in element.find_all('a', href=True):
-                    href = link['href']
-                    full_url = urljoin(self.base_url, href)
-                    
-                    if self._is_news_press_url(full_url, link):
-                        article_links.add(full_url)
-        
-        # Strategy 2: Look for links with news/press indicators in text or URL
+        # One pass over the anchors covers every strategy. Links inside
+        # news-like containers were only ever accepted when they also passed
+        # _is_news_press_url, which is checked for every anchor anyway
         for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = urljoin(self.base_url, href)
-            link_text = link.get_text(strip=True).lower()
+            full_url = _urljoin(self.base_url, link['href'])
+            if full_url in article_links:
+                continue
             
-            # Check URL and link text for news/press indicators
-            if self._is_news_press_url(full_url, link):
+            # Strategy 1: news/press indicators in the link text or URL
+            # Strategy 2: common URL patterns for news/press articles
+            if (self._is_news_press_url(full_url, link) or
+                    (ARTICLE_URL_RE.search(full_url.lower()) and
+                     self._is_valid_article_url(full_url))):
                 article_links.add(full_url)
         
-        # Strategy 3: Look for specific URL patterns
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = urljoin(self.base_url, href)
-            
-            # Common patterns for news/press articles
-            if any(pattern in full_url.lower() for pattern in [
-                '/post/', '/news/', '/press/', '/article/', '/story/',
-                '/release/', '/update/', '/announcement/'
-            ]):
-                if self._is_valid_article_url(full_url):
-                    article_links.add(full_url)
-        
         # Remove duplicates and sort
         unique_links = list(article_links)
         unique_links.sort()
         
-        print(f"   📝 Strategy breakdown:")
-        print(f"      - Total unique links found: {len(unique_links)}")
+        logger.debug("   📝 Total unique links found: %d", len(unique_links))
         
         return unique_links
     
@@ -196,38 +421,21 @@ class NewsPressCrawler:
             return False
         
         # Skip unwanted file types and pages
-        skip_patterns = [
-            'javascript:', 'mailto:', '#', '.css', '.js', '.jpg', '.png', 
-            '.gif', '.pdf', '.ico', '.svg', 'contact', 'about', 'privacy', 
-            'terms', 'policies.html', 'authors-list.html'
-        ]
-        
         url_lower = url.lower()
-        for pattern in skip_patterns:
-            if pattern in url_lower:
-                return False
+        if SKIP_RE.search(url_lower):
+            return False
         
         # Skip homepage variants
         if url_lower.endswith(('/index.html', '/', '/index')):
             return False
         
-        # Check link text for news/press indicators
-        link_text = link_element.get_text(strip=True).lower()
-        news_press_keywords = [
-            'news', 'press', 'release', 'article', 'story', 'update',
-            'announcement', 'statement', 'kingston', 'victor', 'campaign',
-            'beyond', 'future', 'vision', 'building', 'people'
-        ]
-        
-        text_has_keywords = any(keyword in link_text for keyword in news_press_keywords)
-        
         # Check URL structure for article patterns
-        url_has_pattern = any(pattern in url_lower for pattern in [
-            '/post/', '/news/', '/press/', '/article/', '/story/',
-            '/release/', '/2025-', 'kingston', 'beyond', 'future'
-        ])
+        if NEWS_PRESS_URL_RE.search(url_lower):
+            return True
         
-        return text_has_keywords or url_has_pattern
+        # Check link text for news/press indicators
+        link_text = link_element.get_text(strip=True).lower()
+        return NEWS_PRESS_KEYWORDS_RE.search(link_text) is not None
     
     def _is_valid_article_url(self, url: str) -> bool:
         """
@@ -263,39 +471,54 @@ class NewsPressCrawler:
         Returns:
             Dict: Article data with title, content, summary
         """
-        if url in self.processed_urls:
-            return None
-        
-        self.processed_urls.add(url)
+        with self._processed_lock:
+            if url in self.processed_urls:
+                return None
+            self.processed_urls.add(url)
         
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            with self.session.get(url, timeout=15, stream=True,
+                                  headers=self._revalidation_headers(url)) as response:
+                response.raise_for_status()
+                if response.status_code == 304:
+                    return dict(self._page_cache[url][1])
+                
+                # Links the URL heuristics let through can still be PDFs or
+                # images; leave their bodies unread
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type.lower():
+                    logger.debug("   ⏭️  Skipping non-HTML %s (%s)", url, content_type)
+                    return None
+                soup = self._parse_html(response, parse_only=ARTICLE_STRAINER)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Index the elements several extractors fall back on, once
+            paragraphs = soup.find_all('p')
+            headings = soup.find_all(['h1', 'h2'])
             
             # Extract title
             title = self._extract_title(soup)
             
             # Extract main content
-            content = self._extract_content(soup)
+            content = self._extract_content(soup, paragraphs=paragraphs, headings=headings)
             
             # Extract or generate summary
-            summary = self._extract_summary(soup, content)
+            summary = self._extract_summary(soup, content, paragraphs=paragraphs)
             
             # Validate that we have meaningful content
             if not title or len(content) < 100:
-                print(f"   ⚠️  Insufficient content extracted from {url}")
+                logger.warning("   ⚠️  Insufficient content extracted from %s", url)
                 return None
             
-            return {
+            article = {
                 "title": title,
                 "content": content,
                 "summary": summary
             }
+            self._remember_page(url, response, article)
+            return dict(article)
             
         except Exception as e:
-            print(f"   ❌ Error extracting from {url}: {e}")
+            logger.warning("   ❌ Error extracting from %s: %s", url, e)
             return None
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
@@ -309,7 +532,7 @@ class NewsPressCrawler:
             str: Article title
         """
         # Strategy 1: Look for main heading
-        for selector in ['h1', 'h2', '.title', '.headline', '.article-title', '.post-title']:
+        for selector in self.TITLE_SELECTORS:
             title_elem = soup.select_one(selector)
             if title_elem:
                 title = title_elem.get_text(strip=True)
@@ -328,12 +551,15 @@ class NewsPressCrawler:
         
         return "Untitled Article"
     
-    def _extract_content(self, soup: BeautifulSoup) -> str:
+    def _extract_content(self, soup: BeautifulSoup, paragraphs: Optional[List] = None,
+                         headings: Optional[List] = None) -> str:
         """
         Extract main article content.
         
         Args:
             soup: BeautifulSoup object of the article page
+            paragraphs: Pre-computed <p> elements of the page, if available
+            headings: Pre-computed <h1>/<h2> elements of the page, if available
             
         Returns:
             str: Article content
@@ -345,20 +571,7 @@ class NewsPressCrawler:
             element.decompose()
         
         # Strategy 1: Look for main content containers
-        content_selectors = [
-            'article',
-            '[role="main"]',
-            '.content',
-            '.article-content',
-            '.post-content',
-            '.main-content',
-            'main',
-            '.entry-content',
-            '.article-body',
-            '.post-body'
-        ]
-        
-        for selector in content_selectors:
+        for selector in self.CONTENT_SELECTORS:
             content_elem = soup.select_one(selector)
             if content_elem:
                 text = content_elem.get_text(separator='\n', strip=True)
@@ -368,42 +581,70 @@ class NewsPressCrawler:
         # Strategy 2: Collect all paragraphs and meaningful content
         content_parts = []
         
-        # Find content after the main heading
-        main_heading = soup.find(['h1', 'h2'])
+        # Find content after the main heading. Elements in the pre-computed
+        # lists may have been removed by the clean-up above
+        if headings is None:
+            main_heading = soup.find(['h1', 'h2'])
+        else:
+            main_heading = next((h for h in headings if not h.decomposed), None)
         content_area = soup
         
         if main_heading:
-            # Get content after the main heading
-            for sibling in main_heading.find_next_siblings():
-                if sibling.name in ['p', 'div', 'section', 'article']:
+            # Get content after the main heading, walking the siblings lazily
+            collected = 0
+            for sibling in main_heading.next_siblings:
+                if sibling.name in CONTENT_TAGS:
                     text = sibling.get_text(strip=True)
                     if len(text) > 20:  # Skip very short text
                         content_parts.append(text)
+                        collected += len(text)
+                        if collected > MAX_SIBLING_CONTENT_CHARS:
+                            break
         
-        # If no content found after heading, collect all paragraphs
+        # If no content found after heading, collect all paragraphs. Divs are
+        # only used when there are none: a div's text repeats that of every
+        # paragraph inside it, and re-extracting it is quadratic in nesting
+        if not content_parts:
+            if paragraphs is None:
+                paragraphs = soup.find_all('p')
+            content_parts = self._collect_text(
+                (p for p in paragraphs if not p.decomposed), 30)
         if not content_parts:
-            for elem in soup.find_all(['p', 'div']):
-                text = elem.get_text(strip=True)
-                if len(text) > 30:  # Skip short text snippets
-                    content_parts.append(text)
+            content_parts = self._collect_text(soup.find_all('div'), 30)
         
         content = '\n\n'.join(content_parts) if content_parts else "No content found"
         return self._clean_content(content)
     
-    def _extract_summary(self, soup: BeautifulSoup, content: str) -> str:
+    @staticmethod
+    def _collect_text(elements, min_length: int) -> List[str]:
+        """
+        Collect the stripped text of elements longer than a minimum length.
+        
+        Args:
+            elements: Elements to read text from
+            min_length: Texts of this length or shorter are skipped
+            
+        Returns:
+            List[str]: Texts in element order
+        """
+        texts = (elem.get_text(strip=True) for elem in elements)
+        return [text for text in texts if len(text) > min_length]
+    
+    def _extract_summary(self, soup: BeautifulSoup, content: str,
+                         paragraphs: Optional[List] = None) -> str:
         """
         Extract or generate article summary.
         
         Args:
             soup: BeautifulSoup object of the article page
             content: Full article content
+            paragraphs: Pre-computed <p> elements of the page, if available
             
         Returns:
             str: Article summary
         """
         # Strategy 1: Look for explicit summary/excerpt
-        for selector in ['.summary', '.excerpt', '.lead', '.intro', 
-                        '.description', '.abstract', '.preview']:
+        for selector in self.SUMMARY_SELECTORS:
             summary_elem = soup.select_one(selector)
             if summary_elem:
                 summary = summary_elem.get_text(strip=True)
@@ -411,14 +652,19 @@ class NewsPressCrawler:
                     return summary
         
         # Strategy 2: Use first substantial paragraph
-        for p in soup.find_all('p'):
+        if paragraphs is None:
+            paragraphs = soup.find_all('p')
+        for p in paragraphs:
+            if p.decomposed:
+                continue
             text = p.get_text(strip=True)
             if 100 <= len(text) <= 400:  # Good summary length
                 return text
         
         # Strategy 3: Generate from content (first few sentences)
         if content and len(content) > 100:
-            sentences = content.split('. ')
+            # Only the first three sentences are used; stop splitting there
+            sentences = content.split('. ', 3)
             if len(sentences) >= 2:
                 # Take first 1-3 sentences
                 summary_sentences = sentences[:3]
@@ -444,26 +690,12 @@ class NewsPressCrawler:
         Returns:
             str: Cleaned text
         """
-        import re
-        
         # Remove excessive whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' {2,}', ' ', text)
+        text = self._WS_NEWLINES.sub('\n\n', text)
+        text = self._WS_SPACES.sub(' ', text)
         
         # Remove common navigation text
-        navigation_patterns = [
-            r'Home.*?Contact',
-            r'Skip to.*?content',
-            r'Navigation.*?menu',
-            r'Search.*?site',
-            r'Copyright.*?\d{4}',
-            r'All rights reserved',
-            r'Privacy.*?Policy',
-            r'Terms.*?Service'
-        ]
-        
-        for pattern in navigation_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+        text = self._NAV_RE.sub('', text)
         
         return text.strip()
     
@@ -485,19 +717,21 @@ class NewsPressCrawler:
         filepath = Path(filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             
-            print(f"💾 Data saved to: {filepath.absolute()}")
+            logger.info("💾 Data saved to: %s", filepath.absolute())
             return str(filepath.absolute())
             
         except Exception as e:
-            print(f"❌ Error saving data: {e}")
+            logger.error("❌ Error saving data: %s", e)
             return ""
 
 
 def main():
     """Main execution function."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("📰 Victor Campaign News & Press Releases Crawler")
     print("=" * 55)
     
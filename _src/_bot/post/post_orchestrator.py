@@ -18,18 +18,77 @@ Features:
 - Configurable content generation parameters
 """
 
+import asyncio
 import json
+import logging
+import os
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 # Import our custom modules
 from news_press_crawler import NewsPressCrawler
-from azure_openai_client import VictorCampaignAzureOpenAI
+from azure_openai_client import VictorCampaignAzureOpenAI, TokenBucket, CHARS_PER_TOKEN
 from social_helper import TwooterTeamBot
 import random
 
+logger = logging.getLogger(__name__)
+
+# Platform posting rate; the old fixed spacing of ~20s between posts works out
+# to 3 posts a minute
+POSTS_PER_MINUTE = float(os.getenv("TWOOTER_POSTS_PER_MINUTE", "3"))
+
+# Upper bound, in seconds, for one backoff wait after the platform rate limits
+# a post without saying how long to wait
+MAX_POST_RETRY_DELAY = 60
+
+# Articles packed into one Azure OpenAI request in step 3
+ARTICLES_PER_REQUEST = 5
+
+# Prompt budgets in tokens, estimated like the Azure OpenAI client does: one
+# prompt, and one article summary within it
+MAX_PROMPT_TOKENS = 500
+SUMMARY_TOKENS = 75
+
+# Seconds a fetched trending feed is reused by later workflow runs
+TRENDING_TTL = 300
+
+# Articles whose title + summary share more than this fraction of their word
+# 3-grams (Jaccard) are treated as the same story and generated for once
+DUPLICATE_ARTICLE_THRESHOLD = 0.8
+
+# Campaign themes appended to every article prompt
+_CAMPAIGN_THEMES = ''.join([
+    "\n\nVictor Hawthorne Campaign Themes:",
+    "- Free tertiary education and expanded vocational grants",
+    "- Progressive taxation for fairness",
+    "- Aggressive action on climate change",
+    "- Ending offshore drilling",
+    "- Strengthening worker protections",
+    "- Supporting renters' rights",
+])
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Trim text to an estimated token budget, cutting at a word boundary.
+    
+    Args:
+        text (str): Text to trim
+        max_tokens (int): Token budget for the text
+        
+    Returns:
+        str: text unchanged if it fits, otherwise its head followed by "..."
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rsplit(' ', 1)[0] + "..."
+
+
 class PostOrchestrator:
     """
     Main orchestrator class that coordinates the automated content generation
@@ -48,6 +107,20 @@ class PostOrchestrator:
         self.ai_client = None
         self.social_bot = None
         
+        # Paces posting across workflow runs. A capacity of one means no
+        # bursts: posts stay spaced by 60 / POSTS_PER_MINUTE seconds
+        self._post_limiter = TokenBucket(POSTS_PER_MINUTE, capacity=1)
+        
+        # Last trending feed as (fetched at, limit, data), reused for TRENDING_TTL
+        self._trending_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None
+        
+        # Prompt block for the trending data last formatted, as (data, block)
+        self._trending_block_cache: Optional[Tuple[Dict[str, Any], str]] = None
+        
+        # The social bot is started on first use and kept running across
+        # workflow runs, so its session is authenticated once
+        self._bot_lock = threading.Lock()
+        
         # Initialize components
         self._initialize_components()
         
@@ -72,6 +145,23 @@ class PostOrchestrator:
             print(f"❌ Error initializing components: {e}")
             raise
     
+    def _ensure_social_bot(self):
+        """
+        Start the social media bot unless it is already running.
+        
+        Raises:
+            Exception: If the bot fails to start
+        """
+        with self._bot_lock:
+            if not self.social_bot.running and not self.social_bot.start():
+                raise Exception("Failed to start social media bot")
+    
+    def close(self):
+        """Stop the social media bot if it was started."""
+        if self.social_bot and self.social_bot.running:
+            self.social_bot.stop()
+            logger.info("🛑 Social bot stopped")
+    
     def get_news_and_press_data(self) -> Dict[str, Any]:
         """
         First function: Call news_press_crawler and get the data.
@@ -79,8 +169,8 @@ class PostOrchestrator:
         Returns:
             Dict[str, Any]: News and press release data from Victor's campaign
         """
-        print("\n📰 Step 1: Fetching News and Press Releases...")
-        print("=" * 50)
+        logger.info("\n📰 Step 1: Fetching News and Press Releases...")
+        logger.info("=" * 50)
         
         try:
             # Use the crawler to get latest news and press releases
@@ -88,75 +178,109 @@ class PostOrchestrator:
             
             if data and data.get('main'):
                 articles_count = len(data['main'])
-                print(f"✅ Successfully retrieved {articles_count} articles")
+                logger.info("✅ Successfully retrieved %d articles", articles_count)
                 
                 # Display brief summary of articles
-                for i, article in enumerate(data['main'][:3], 1):  # Show first 3
-                    title = article['title'][:60] + "..." if len(article['title']) > 60 else article['title']
-                    print(f"   {i}. {title}")
-                
-                if len(data['main']) > 3:
-                    print(f"   ... and {len(data['main']) - 3} more articles")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, article in enumerate(data['main'][:3], 1):  # Show first 3
+                        title = article['title'][:60] + "..." if len(article['title']) > 60 else article['title']
+                        logger.debug("   %d. %s", i, title)
+                    
+                    if len(data['main']) > 3:
+                        logger.debug("   ... and %d more articles", len(data['main']) - 3)
                 
                 return data
             else:
-                print("⚠️  No articles found from news/press crawler")
+                logger.warning("⚠️  No articles found from news/press crawler")
                 return {"main": [], "metadata": {"error": "No articles found"}}
                 
         except Exception as e:
-            print(f"❌ Error fetching news/press data: {e}")
+            logger.error("❌ Error fetching news/press data: %s", e)
             return {"main": [], "metadata": {"error": str(e)}}
     
     def get_trending_social_data(self, limit: int = 5) -> Dict[str, Any]:
         """
         Second function: Call social_helper.py --trending and get latest trending data.
         
+        Trending feeds change slowly, so a successful result is reused for
+        TRENDING_TTL seconds by later calls asking for the same limit.
+        
         Args:
             limit (int): Number of trending posts to retrieve (default: 5)
             
         Returns:
             Dict[str, Any]: Trending posts data from the platform
         """
-        print(f"\n📈 Step 2: Fetching Trending Social Media Posts...")
-        print("=" * 50)
+        logger.info("\n📈 Step 2: Fetching Trending Social Media Posts...")
+        logger.info("=" * 50)
+        
+        cached = self._trending_cache
+        if cached and cached[1] == limit and time.monotonic() - cached[0] < TRENDING_TTL:
+            logger.info("♻️  Using trending posts fetched %.0fs ago", time.monotonic() - cached[0])
+            return cached[2]
         
         try:
-            # Start the social bot if not already started
-            if not self.social_bot.running:
-                if not self.social_bot.start():
-                    raise Exception("Failed to start social media bot")
+            self._ensure_social_bot()
             
             # Get trending posts using the social bot's method
             trending_data = self.social_bot.get_trending_posts(limit=limit)
             
             if trending_data and trending_data.get('data'):
                 posts_count = len(trending_data['data'])
-                print(f"✅ Successfully retrieved {posts_count} trending posts")
+                logger.info("✅ Successfully retrieved %d trending posts", posts_count)
                 
                 # Display brief summary of trending posts
-                for i, post in enumerate(trending_data['data'][:3], 1):  # Show first 3
-                    author = post.get('author', {}).get('username', 'Unknown')
-                    content_preview = post.get('content', '')[:50] + "..." if len(post.get('content', '')) > 50 else post.get('content', '')
-                    print(f"   {i}. @{author}: {content_preview}")
-                
-                if len(trending_data['data']) > 3:
-                    print(f"   ... and {len(trending_data['data']) - 3} more posts")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, post in enumerate(trending_data['data'][:3], 1):  # Show first 3
+                        author = post.get('author', {}).get('username', 'Unknown')
+                        content_preview = post.get('content', '')[:50] + "..." if len(post.get('content', '')) > 50 else post.get('content', '')
+                        logger.debug("   %d. @%s: %s", i, author, content_preview)
+                    
+                    if len(trending_data['data']) > 3:
+                        logger.debug("   ... and %d more posts", len(trending_data['data']) - 3)
                 
+                self._trending_cache = (time.monotonic(), limit, trending_data)
                 return trending_data
             else:
-                print("⚠️  No trending posts found")
+                logger.warning("⚠️  No trending posts found")
                 return {"data": [], "metadata": {"error": "No trending posts found"}}
                 
         except Exception as e:
-            print(f"❌ Error fetching trending social data: {e}")
+            logger.error("❌ Error fetching trending social data: %s", e)
             return {"data": [], "metadata": {"error": str(e)}}
     
-    def generate_social_content(self, news_data: Dict[str, Any], 
-                              trending_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def get_news_and_press_data_async(self) -> Dict[str, Any]:
+        """
+        Async version of get_news_and_press_data; the crawl runs in a worker thread.
+        
+        Returns:
+            Dict[str, Any]: News and press release data from Victor's campaign
+        """
+        return await asyncio.to_thread(self.get_news_and_press_data)
+    
+    async def get_trending_social_data_async(self, limit: int = 5) -> Dict[str, Any]:
+        """
+        Async version of get_trending_social_data; the platform calls run in a worker thread.
+        
+        Args:
+            limit (int): Number of trending posts to retrieve (default: 5)
+            
+        Returns:
+            Dict[str, Any]: Trending posts data from the platform
+        """
+        return await asyncio.to_thread(self.get_trending_social_data, limit)
+    
+    async def generate_social_content(self, news_data: Dict[str, Any], 
+                                      trending_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Third function: Loop through each news item, concatenate with all trending data,
         and generate social media content for each news article.
         
+        Articles are packed ARTICLES_PER_REQUEST to a request and the groups
+        are generated concurrently; the Azure OpenAI client caps the number
+        of requests in flight and holds requests back to stay within its
+        RPM/TPM quota.
+        
         Args:
             news_data (Dict[str, Any]): News and press release data
             trending_data (Dict[str, Any]): Trending social media posts data
@@ -164,8 +288,8 @@ class PostOrchestrator:
         Returns:
             List[Dict[str, Any]]: List of generated social media posts with metadata
         """
-        print(f"\n🤖 Step 3: Generating Social Media Content...")
-        print("=" * 50)
+        logger.info("\n🤖 Step 3: Generating Social Media Content...")
+        logger.info("=" * 50)
         
         generated_posts = []
         
@@ -173,8 +297,8 @@ class PostOrchestrator:
             news_articles = news_data.get('main', [])
             
             if not news_articles:
-                print("⚠️  No news articles found. Generating AI-powered fallback post based on Victor's policies...")
-                fallback_msg = self._generate_policy_based_fallback_post(trending_data)
+                logger.warning("⚠️  No news articles found. Generating AI-powered fallback post based on Victor's policies...")
+                fallback_msg = await self._generate_policy_based_fallback_post(trending_data)
                 generated_posts.append({
                     "content": fallback_msg,
                     "news_title": "AI-Generated Policy Post",
@@ -182,64 +306,24 @@ class PostOrchestrator:
                 })
                 return generated_posts
             
-            print(f"📰 Processing {len(news_articles)} news articles...")
+            news_articles = self._dedupe_articles(news_articles)
+            logger.info("📰 Processing %d news articles...", len(news_articles))
             
-            # Loop through each news article
-            for i, article in enumerate(news_articles, 1):
-                try:
-                    print(f"\n📝 Generating content for article {i}/{len(news_articles)}: {article.get('title', 'Unknown')[:50]}...")
-                    
-                    # Prepare content for this specific article + all trending data
-                    combined_content = self._prepare_content_for_ai_single_article(article, trending_data)
-                    
-                    print(f"   📝 Prepared {len(combined_content)} characters for AI processing")
-                    
-                    # Generate social media post using Azure OpenAI
-                    generated_post = self.ai_client.generate_social_post(combined_content)
-                    
-                    # Add rate limiting delay after AI generation to prevent 429 errors
-                    if i < len(news_articles):
-                        ai_delay = 3  # 3 seconds between AI API calls
-                        print(f"   ⏳ Rate limiting: waiting {ai_delay}s before next AI generation...")
-                        time.sleep(ai_delay)
-                    
-                    if generated_post:
-                        print(f"   ✅ Generated post ({len(generated_post)} characters)")
-                        print(f"   📱 Content: \"{generated_post[:100]}{'...' if len(generated_post) > 100 else ''}\"")
-                        
-                        generated_posts.append({
-                            "content": generated_post,
-                            "news_title": article.get('title', 'Unknown'),
-                            "news_id": i,
-                            "success": True
-                        })
-                    else:
-                        print(f"   ❌ Failed to generate content for article {i}")
-                        generated_posts.append({
-                            "content": f"🇺🇸 Victor Hawthorne: {article.get('title', 'Latest Update')[:100]}... #VictorForPresident",
-                            "news_title": article.get('title', 'Unknown'),
-                            "news_id": i,
-                            "success": False,
-                            "error": "No content generated"
-                        })
-                
-                except Exception as e:
-                    print(f"   ❌ Error generating content for article {i}: {e}")
-                    generated_posts.append({
-                        "content": f"🇺🇸 Victor Hawthorne: {article.get('title', 'Latest Update')[:100]}... #VictorForPresident",
-                        "news_title": article.get('title', 'Unknown'),
-                        "news_id": i,
-                        "success": False,
-                        "error": str(e)
-                    })
+            # Generate every group at once; results keep article order
+            groups = await asyncio.gather(*(
+                self._generate_posts_for_group(start + 1, news_articles[start:start + ARTICLES_PER_REQUEST],
+                                               trending_data, len(news_articles))
+                for start in range(0, len(news_articles), ARTICLES_PER_REQUEST)
+            ))
+            generated_posts = [post for group in groups for post in group]
             
             successful_posts = sum(1 for post in generated_posts if post.get('success'))
-            print(f"\n✅ Content generation complete: {successful_posts}/{len(generated_posts)} successful")
+            logger.info("\n✅ Content generation complete: %d/%d successful", successful_posts, len(generated_posts))
             
             return generated_posts
                 
         except Exception as e:
-            print(f"❌ Fatal error generating social content: {e}")
+            logger.error("❌ Fatal error generating social content: %s", e)
             # Return a single fallback message
             fallback_msg = "🇺🇸 Victor Hawthorne for President! Join the movement for fairness, opportunity, and a sustainable future. #VictorForPresident #FairnessForAll #ClimateAction"
             return [{
@@ -249,6 +333,135 @@ class PostOrchestrator:
                 "error": str(e)
             }]
     
+    def _dedupe_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop articles that are near-duplicates of an earlier one.
+        
+        Articles are compared on the word 3-grams of their title plus the
+        start of their summary, using the crawler's shingling and Jaccard
+        helpers; the first article of each duplicate set is kept.
+        
+        Args:
+            articles (List[Dict[str, Any]]): News articles in crawl order
+            
+        Returns:
+            List[Dict[str, Any]]: Articles to generate posts for
+        """
+        kept = []
+        kept_shingles = []
+        for article in articles:
+            text = f"{article.get('title', '')} {article.get('summary', '')[:300]}"
+            shingles = NewsPressCrawler._content_shingles(text, 3)
+            
+            if any(NewsPressCrawler._jaccard(shingles, prior) > DUPLICATE_ARTICLE_THRESHOLD
+                   for prior in kept_shingles):
+                logger.info("   ⏭️  Skipping near-duplicate article: %.50s", article.get('title', 'Unknown'))
+                continue
+            
+            kept.append(article)
+            kept_shingles.append(shingles)
+        return kept
+    
+    async def _generate_posts_for_group(self, first: int, articles: List[Dict[str, Any]],
+                                        trending_data: Dict[str, Any], total: int) -> List[Dict[str, Any]]:
+        """
+        Generate the social media posts for a group of articles in one request.
+        
+        If the combined request fails or doesn't return a post for every
+        article, the group falls back to one request per article.
+        
+        Args:
+            first (int): 1-based position of the group's first article
+            articles (List[Dict[str, Any]]): News articles in the group
+            trending_data (Dict[str, Any]): All trending social media posts data
+            total (int): Number of articles being processed
+            
+        Returns:
+            List[Dict[str, Any]]: Generated posts with metadata, in article order
+        """
+        if len(articles) > 1:
+            last = first + len(articles) - 1
+            try:
+                logger.debug("\n📝 Generating content for articles %d-%d/%d in one request...", first, last, total)
+                combined_content = self._prepare_content_for_ai_articles(articles, trending_data)
+                logger.debug("   📝 Prepared %d characters for AI processing", len(combined_content))
+                
+                posts = await self.ai_client.generate_social_posts_for_articles_async(
+                    combined_content, len(articles))
+                
+                logger.debug("   ✅ Generated %d posts for articles %d-%d", len(posts), first, last)
+                return [
+                    {
+                        "content": post,
+                        "news_title": article.get('title', 'Unknown'),
+                        "news_id": i,
+                        "success": True
+                    }
+                    for i, (article, post) in enumerate(zip(articles, posts), first)
+                ]
+            except Exception as e:
+                logger.warning("   ⚠️  Combined generation failed for articles %d-%d (%s), "
+                               "generating them one by one", first, last, e)
+        
+        return await asyncio.gather(*(
+            self._generate_post_for_article(i, article, trending_data, total)
+            for i, article in enumerate(articles, first)
+        ))
+    
+    async def _generate_post_for_article(self, i: int, article: Dict[str, Any],
+                                         trending_data: Dict[str, Any], total: int) -> Dict[str, Any]:
+        """
+        Generate the social media post for a single news article.
+        
+        Errors are caught and reported in the returned record, so one failed
+        article doesn't abort the others.
+        
+        Args:
+            i (int): 1-based position of the article
+            article (Dict[str, Any]): News article data
+            trending_data (Dict[str, Any]): All trending social media posts data
+            total (int): Number of articles being processed
+            
+        Returns:
+            Dict[str, Any]: Generated post with metadata
+        """
+        try:
+            logger.debug("\n📝 Generating content for article %d/%d: %.50s...", i, total, article.get('title', 'Unknown'))
+            
+            # Prepare content for this specific article + all trending data
+            combined_content = self._prepare_content_for_ai_single_article(article, trending_data)
+            
+            logger.debug("   📝 Prepared %d characters for AI processing", len(combined_content))
+            
+            # Generate social media post using Azure OpenAI
+            generated_post = await self.ai_client.generate_social_post_async(combined_content)
+            
+            if generated_post:
+                logger.debug("   ✅ Generated post %d (%d characters)", i, len(generated_post))
+                logger.debug("   📱 Content: \"%.100s%s\"", generated_post, '...' if len(generated_post) > 100 else '')
+                
+                return {
+                    "content": generated_post,
+                    "news_title": article.get('title', 'Unknown'),
+                    "news_id": i,
+                    "success": True
+                }
+            
+            logger.warning("   ❌ Failed to generate content for article %d", i)
+            error = "No content generated"
+        
+        except Exception as e:
+            logger.warning("   ❌ Error generating content for article %d: %s", i, e)
+            error = str(e)
+        
+        return {
+            "content": f"🇺🇸 Victor Hawthorne: {article.get('title', 'Latest Update')[:100]}... #VictorForPresident",
+            "news_title": article.get('title', 'Unknown'),
+            "news_id": i,
+            "success": False,
+            "error": error
+        }
+    
     def _prepare_content_for_ai_single_article(self, article: Dict[str, Any], 
                                              trending_data: Dict[str, Any]) -> str:
         """
@@ -261,17 +474,40 @@ class PostOrchestrator:
         Returns:
             str: Combined and formatted content for AI processing
         """
-        content_parts = []
-        
-        # Add specific Victor Hawthorne article information
-        content_parts.append("Victor Hawthorne Press Release:")
         title = article.get('title', 'No title')
-        summary = article.get('summary', article.get('content', ''))[:300]  # Limit summary length
-        content_parts.append(f"\nTitle: {title}")
-        content_parts.append(f"Summary: {summary}")
+        summary = _truncate_to_tokens(article.get('summary', article.get('content', '')), SUMMARY_TOKENS)
         
-        # Add trending social media posts
-        content_parts.append("\n\nTrending Social Media Posts:")
+        # Article information, then the trending posts and campaign themes
+        # shared by every article
+        combined_content = ''.join([
+            "Victor Hawthorne Press Release:",
+            f"\nTitle: {title}",
+            f"Summary: {summary}",
+            self._format_trending_block(trending_data),
+            _CAMPAIGN_THEMES
+        ])
+        
+        # Ensure content isn't too long for the AI model
+        return _truncate_to_tokens(combined_content, MAX_PROMPT_TOKENS)
+    
+    def _format_trending_block(self, trending_data: Dict[str, Any]) -> str:
+        """
+        Format the trending posts section of an article prompt.
+        
+        The block is the same for every article in a run, so it is built
+        once per trending data and reused.
+        
+        Args:
+            trending_data (Dict[str, Any]): All trending social media posts data
+            
+        Returns:
+            str: Trending posts section
+        """
+        cached = self._trending_block_cache
+        if cached and cached[0] is trending_data:
+            return cached[1]
+        
+        content_parts = ["\n\nTrending Social Media Posts:"]
         
         if trending_data.get('data'):
             for i, post in enumerate(trending_data['data'][:5], 1):  # Use top 5 trending posts
@@ -281,24 +517,45 @@ class PostOrchestrator:
         else:
             content_parts.append("\nNo trending posts available.")
         
-        # Add campaign themes
-        content_parts.append("\n\nVictor Hawthorne Campaign Themes:")
-        content_parts.append("- Free tertiary education and expanded vocational grants")
-        content_parts.append("- Progressive taxation for fairness")
-        content_parts.append("- Aggressive action on climate change")
-        content_parts.append("- Ending offshore drilling")
-        content_parts.append("- Strengthening worker protections")
-        content_parts.append("- Supporting renters' rights")
+        block = ''.join(content_parts)
+        self._trending_block_cache = (trending_data, block)
+        return block
+    
+    def _prepare_content_for_ai_articles(self, articles: List[Dict[str, Any]],
+                                         trending_data: Dict[str, Any]) -> str:
+        """
+        Prepare content for AI generation covering several news articles at once.
+        
+        The articles are numbered from 1 so the model can key its posts by
+        number; trending posts and campaign themes are included once.
         
-        combined_content = ''.join(content_parts)
+        Args:
+            articles (List[Dict[str, Any]]): News articles to cover
+            trending_data (Dict[str, Any]): All trending social media posts data
+            
+        Returns:
+            str: Combined and formatted content for AI processing
+        """
+        content_parts = []
         
-        # Ensure content isn't too long for the AI model
-        if len(combined_content) > 2000:
-            combined_content = combined_content[:2000] + "..."
+        # Add the Victor Hawthorne articles, one numbered block each
+        for i, article in enumerate(articles, 1):
+            title = article.get('title', 'No title')
+            summary = _truncate_to_tokens(article.get('summary', article.get('content', '')), SUMMARY_TOKENS)
+            content_parts.append(f"===ARTICLE {i}===\nVictor Hawthorne Press Release:")
+            content_parts.append(f"\nTitle: {title}")
+            content_parts.append(f"\nSummary: {summary}\n")
+        
+        # Add trending social media posts and campaign themes
+        content_parts.append(self._format_trending_block(trending_data))
+        content_parts.append(_CAMPAIGN_THEMES)
         
-        return combined_content
+        # Ensure content isn't too long for the AI model, leaving room for
+        # every article's summary so none is cut off the end
+        max_tokens = MAX_PROMPT_TOKENS + SUMMARY_TOKENS * (len(articles) - 1)
+        return _truncate_to_tokens(''.join(content_parts), max_tokens)
     
-    def _generate_policy_based_fallback_post(self, trending_data: Dict[str, Any]) -> str:
+    async def _generate_policy_based_fallback_post(self, trending_data: Dict[str, Any]) -> str:
         """
         Generate an AI-powered fallback post based on Victor Hawthorne's core policies.
         
@@ -309,24 +566,24 @@ class PostOrchestrator:
             str: AI-generated social media post based on policies
         """
         try:
-            print("🤖 Generating AI-powered policy-based post...")
+            logger.info("🤖 Generating AI-powered policy-based post...")
             
             # Prepare content for AI with Victor's key policies
             policy_content = self._prepare_policy_content_for_ai(trending_data)
             
             # Generate post using Azure OpenAI
-            generated_post = self.ai_client.generate_social_post(policy_content)
+            generated_post = await self.ai_client.generate_social_post_async(policy_content)
             
             if generated_post and len(generated_post.strip()) > 0:
-                print(f"✅ Generated AI policy post ({len(generated_post)} characters)")
+                logger.info("✅ Generated AI policy post (%d characters)", len(generated_post))
                 return generated_post
             else:
-                print("⚠️ AI generation failed, using policy-based fallback")
+                logger.warning("⚠️ AI generation failed, using policy-based fallback")
                 # Return a policy-based fallback if AI fails
                 return "🇺🇸 Victor Hawthorne: Building a fairer Kingston with free education, climate action, worker protections, and human rights for all! Join the movement for progressive change. @victor_hawthorne #VictorForPresident #ProgressiveChange #Kingston"
                 
         except Exception as e:
-            print(f"❌ Error generating AI policy post: {e}")
+            logger.error("❌ Error generating AI policy post: %s", e)
             # Return a policy-based fallback if there's an error
             return "🇺🇸 Victor Hawthorne: Building a fairer Kingston with free education, climate action, worker protections, and human rights for all! Join the movement for progressive change. @victor_hawthorne #VictorForPresident #ProgressiveChange #Kingston"
     
@@ -368,13 +625,8 @@ class PostOrchestrator:
         content_parts.append("- Appeals to voters who want real policy solutions")
         content_parts.append("- Includes relevant hashtags and @victor_hawthorne mention")
         
-        combined_content = ''.join(content_parts)
-        
         # Ensure content isn't too long for the AI model
-        if len(combined_content) > 2000:
-            combined_content = combined_content[:2000] + "..."
-        
-        return combined_content
+        return _truncate_to_tokens(''.join(content_parts), MAX_PROMPT_TOKENS)
 
     def _prepare_content_for_ai(self, news_data: Dict[str, Any], 
                                trending_data: Dict[str, Any]) -> str:
@@ -396,217 +648,58 @@ class PostOrchestrator:
         if news_data.get('main'):
             for i, article in enumerate(news_data['main'][:3], 1):  # Use top 3 articles
                 title = article.get('title', 'No title')
-                summary = article.get('summary', article.get('content', ''))[:200]  # Limit summary length
+                summary = _truncate_to_tokens(article.get('summary', article.get('content', '')), SUMMARY_TOKENS * 2 // 3)
                 content_parts.append(f"\n{i}. {title}")
                 content_parts.append(f"   Summary: {summary}")
         else:
             content_parts.append("\nNo recent press releases available.")
         
-        # Add trending social media posts
-        content_parts.append("\n\nTrending Social Media Posts:")
-        
-        if trending_data.get('data'):
-            for i, post in enumerate(trending_data['data'][:5], 1):  # Use top 5 trending posts
-                author = post.get('author', {}).get('username', 'Unknown')
-                content = post.get('content', '')[:150]  # Limit content length
-                content_parts.append(f"\n{i}. @{author}: {content}")
-        else:
-            content_parts.append("\nNo trending posts available.")
-        
-        # Add campaign themes
-        content_parts.append("\n\nVictor Hawthorne Campaign Themes:")
-        content_parts.append("- Free tertiary education and expanded vocational grants")
-        content_parts.append("- Progressive taxation for fairness")
-        content_parts.append("- Aggressive action on climate change")
-        content_parts.append("- Ending offshore drilling")
-        content_parts.append("- Strengthening worker protections")
-        content_parts.append("- Supporting renters' rights")
+        # Add trending social media posts and campaign themes
+        content_parts.append(self._format_trending_block(trending_data))
+        content_parts.append(_CAMPAIGN_THEMES)
         
         combined_content = ''.join(content_parts)
         
         # Ensure content isn't too long for the AI model
-        if len(combined_content) > 2000:
-            combined_content = combined_content[:2000] + "..."
-        
-        return combined_content
+        return _truncate_to_tokens(combined_content, MAX_PROMPT_TOKENS)
     
-    def post_social_content(self, generated_posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def post_social_content(self, generated_posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Fourth function: Loop through each generated post and post them individually.
         
+        Posts are published concurrently, paced by a token bucket at
+        POSTS_PER_MINUTE instead of fixed sleeps between posts.
+        
         Args:
             generated_posts (List[Dict[str, Any]]): List of generated social media posts
             
         Returns:
             List[Dict[str, Any]]: List of posting results for each post
         """
-        print(f"\n📤 Step 4: Posting Social Media Content...")
-        print("=" * 50)
-        print("⚠️  IMPORTANT: Ensure only ONE instance of this script is running")
-        print("⚠️  Multiple instances will cause rate limiting conflicts")
-        
-        posting_results = []
+        logger.info("\n📤 Step 4: Posting Social Media Content...")
+        logger.info("=" * 50)
+        logger.warning("⚠️  IMPORTANT: Ensure only ONE instance of this script is running")
+        logger.warning("⚠️  Multiple instances will cause rate limiting conflicts")
         
         try:
-            # Ensure social bot is started
-            if not self.social_bot.running:
-                if not self.social_bot.start():
-                    raise Exception("Failed to start social media bot for posting")
+            self._ensure_social_bot()
             
-            print(f"📝 Posting {len(generated_posts)} social media posts...")
-            print(f"⚠️  Note: Using enhanced rate limiting delays to avoid API limits")
+            logger.info("📝 Posting %d social media posts...", len(generated_posts))
+            logger.info("⚠️  Note: Posting is rate limited to %g posts per minute", POSTS_PER_MINUTE)
             
-            # Add initial delay before first post to avoid rapid API calls
-            initial_delay = 5
-            print(f"   ⏳ Initial delay: waiting {initial_delay}s before first post...")
-            time.sleep(initial_delay)
-            
-            # Loop through each generated post
-            for i, post_data in enumerate(generated_posts, 1):
-                try:
-                    content = post_data.get('content', '')
-                    news_title = post_data.get('news_title', 'Unknown')
-                    
-                    print(f"\n📤 Posting {i}/{len(generated_posts)}: {news_title[:50]}...")
-                    print(f"   📱 Content: \"{content[:100]}{'...' if len(content) > 100 else ''}\"")
-                    
-                    # Retry logic for rate limiting
-                    max_retries = 3
-                    retry_count = 0
-                    posted = False
-                    
-                    while retry_count < max_retries and not posted:
-                        try:
-                            # Small delay before each posting attempt to avoid rapid API calls
-                            if retry_count > 0:  # Only add delay for retries, not first attempt
-                                pre_post_delay = 2
-                                print(f"   ⏳ Pre-posting delay: waiting {pre_post_delay}s...")
-                                time.sleep(pre_post_delay)
-                            
-                            # Create the post using the social bot
-                            post_result = self.social_bot.create_post(content)
-                            
-                            # Handle different response formats
-                            if post_result:
-                                # Check if response has success flag (expected format)
-                                if post_result.get('success'):
-                                    post_id = post_result.get('data', {}).get('id', 'Unknown')
-                                    print(f"   ✅ Successfully posted! Post ID: {post_id}")
-                                    
-                                    posting_results.append({
-                                        "success": True,
-                                        "post_id": post_id,
-                                        "content": content,
-                                        "news_title": news_title,
-                                        "news_id": post_data.get('news_id', i),
-                                        "response": post_result
-                                    })
-                                    posted = True
-                                # Check if response contains post data directly (actual format)
-                                elif post_result.get('id'):
-                                    post_id = post_result.get('id', 'Unknown')
-                                    print(f"   ✅ Successfully posted! Post ID: {post_id}")
-                                    
-                                    posting_results.append({
-                                        "success": True,
-                                        "post_id": post_id,
-                                        "content": content,
-                                        "news_title": news_title,
-                                        "news_id": post_data.get('news_id', i),
-                                        "response": {"success": True, "data": post_result}
-                                    })
-                                    posted = True
-                                # Check if response has 'data' field with post info
-                                elif post_result.get('data', {}).get('id'):
-                                    post_id = post_result.get('data', {}).get('id', 'Unknown')
-                                    print(f"   ✅ Successfully posted! Post ID: {post_id}")
-                                    
-                                    posting_results.append({
-                                        "success": True,
-                                        "post_id": post_id,
-                                        "content": content,
-                                        "news_title": news_title,
-                                        "news_id": post_data.get('news_id', i),
-                                        "response": {"success": True, "data": post_result.get('data')}
-                                    })
-                                    posted = True
-                                else:
-                                    error_msg = post_result.get('error', 'Unknown response format')
-                                    print(f"   ❌ Failed to post: {error_msg}")
-                                    break  # Don't retry for non-rate-limit errors
-                            else:
-                                print(f"   ❌ Failed to post: No response from server")
-                                break  # Don't retry for no response
-                        
-                        except Exception as post_error:
-                            error_str = str(post_error)
-                            
-                            # Check if it's a rate limiting error
-                            if "429" in error_str or "Too Many Requests" in error_str:
-                                retry_count += 1
-                                if retry_count < max_retries:
-                                    # More aggressive exponential backoff for posting: 10s, 20s, 40s
-                                    wait_time = 10 * (2 ** (retry_count - 1))
-                                    print(f"   ⏳ Rate limit hit. Waiting {wait_time}s before retry {retry_count}/{max_retries}...")
-                                    time.sleep(wait_time)
-                                else:
-                                    print(f"   ❌ Max retries reached. Skipping this post.")
-                                    posting_results.append({
-                                        "success": False,
-                                        "error": f"Rate limit exceeded after {max_retries} retries",
-                                        "content": content,
-                                        "news_title": news_title,
-                                        "news_id": post_data.get('news_id', i)
-                                    })
-                            else:
-                                # Non-rate-limit error, don't retry
-                                print(f"   ❌ Error posting content: {post_error}")
-                                posting_results.append({
-                                    "success": False,
-                                    "error": str(post_error),
-                                    "content": content,
-                                    "news_title": news_title,
-                                    "news_id": post_data.get('news_id', i)
-                                })
-                                break
-                    
-                    # If we haven't posted yet and exhausted retries
-                    if not posted and retry_count >= max_retries:
-                        posting_results.append({
-                            "success": False,
-                            "error": "Failed to post after maximum retries",
-                            "content": content,
-                            "news_title": news_title,
-                            "news_id": post_data.get('news_id', i)
-                        })
-                    
-                    # Add enhanced delay between posts to avoid rate limiting
-                    if i < len(generated_posts):
-                        base_wait_time = 20  # Increased from 15 to 20 seconds
-                        # Add random jitter to avoid synchronized requests (±3 seconds)
-                        jitter = random.randint(-3, 3)
-                        wait_time = base_wait_time + jitter
-                        print(f"   ⏸️  Waiting {wait_time} seconds before next post...")
-                        time.sleep(wait_time)
-                
-                except Exception as e:
-                    print(f"   ❌ Error posting content {i}: {e}")
-                    posting_results.append({
-                        "success": False,
-                        "error": str(e),
-                        "content": post_data.get('content', ''),
-                        "news_title": post_data.get('news_title', 'Unknown'),
-                        "news_id": post_data.get('news_id', i)
-                    })
+            posting_results = await asyncio.gather(*(
+                self._publish_post(i, post_data, len(generated_posts))
+                for i, post_data in enumerate(generated_posts, 1)
+            ))
             
             # Summary
             successful_posts = sum(1 for result in posting_results if result.get('success'))
-            print(f"\n📊 Posting Summary: {successful_posts}/{len(posting_results)} posts successful")
+            logger.info("\n📊 Posting Summary: %d/%d posts successful", successful_posts, len(posting_results))
             
             return posting_results
                 
         except Exception as e:
-            print(f"❌ Fatal error posting social content: {e}")
+            logger.error("❌ Fatal error posting social content: %s", e)
             return [{
                 "success": False,
                 "error": str(e),
@@ -615,11 +708,154 @@ class PostOrchestrator:
                 "news_id": 0
             }]
     
-    def run_complete_workflow(self, trending_limit: int = 5, 
-                            save_data: bool = True, max_posts: int = None) -> Dict[str, Any]:
+    async def _publish_post(self, i: int, post_data: Dict[str, Any], total: int) -> Dict[str, Any]:
+        """
+        Publish a single generated post, retrying on rate limiting.
+        
+        The blocking platform call runs in a worker thread and retries wait
+        with asyncio.sleep, so other posts keep flowing meanwhile.
+        
+        Args:
+            i (int): 1-based position of the post
+            post_data (Dict[str, Any]): Generated post with metadata
+            total (int): Number of posts being published
+            
+        Returns:
+            Dict[str, Any]: Posting result for this post
+        """
+        content = post_data.get('content', '')
+        news_title = post_data.get('news_title', 'Unknown')
+        news_id = post_data.get('news_id', i)
+        
+        def failure(error: str) -> Dict[str, Any]:
+            return {
+                "success": False,
+                "error": error,
+                "content": content,
+                "news_title": news_title,
+                "news_id": news_id
+            }
+        
+        try:
+            # Retry logic for rate limiting
+            max_retries = 3
+            
+            for retry_count in range(max_retries):
+                await self._post_limiter.acquire_async()
+                logger.debug("\n📤 Posting %d/%d: %.50s...", i, total, news_title)
+                logger.debug("   📱 Content: \"%.100s%s\"", content, '...' if len(content) > 100 else '')
+                
+                try:
+                    # Create the post using the social bot
+                    post_result = await asyncio.to_thread(self.social_bot.create_post, content)
+                except Exception as post_error:
+                    error_str = str(post_error)
+                    response = getattr(post_error, "response", None)
+                    
+                    # Non-rate-limit error, don't retry
+                    if response is None or response.status_code != 429:
+                        logger.warning("   ❌ Error posting content: %s", post_error)
+                        return failure(error_str)
+                    
+                    if retry_count == max_retries - 1:
+                        logger.warning("   ❌ Max retries reached. Skipping this post.")
+                        return failure(f"Rate limit exceeded after {max_retries} retries")
+                    
+                    wait_time = self._post_retry_delay(post_error, retry_count)
+                    logger.warning("   ⏳ Rate limit hit. Waiting %.1fs before retry %d/%d...",
+                                   wait_time, retry_count + 1, max_retries)
+                    await asyncio.sleep(wait_time)
+                    continue
+                
+                # Handle different response formats
+                if not post_result:
+                    logger.warning("   ❌ Failed to post: No response from server")
+                    return failure("No response from server")
+                
+                # Check if response has success flag (expected format)
+                if post_result.get('success'):
+                    post_id = post_result.get('data', {}).get('id', 'Unknown')
+                    response = post_result
+                # Check if response contains post data directly (actual format)
+                elif post_result.get('id'):
+                    post_id = post_result.get('id', 'Unknown')
+                    response = {"success": True, "data": post_result}
+                # Check if response has 'data' field with post info
+                elif post_result.get('data', {}).get('id'):
+                    post_id = post_result.get('data', {}).get('id', 'Unknown')
+                    response = {"success": True, "data": post_result.get('data')}
+                else:
+                    error_msg = post_result.get('error', 'Unknown response format')
+                    logger.warning("   ❌ Failed to post: %s", error_msg)
+                    return failure(error_msg)
+                
+                logger.info("   ✅ Successfully posted! Post ID: %s", post_id)
+                return {
+                    "success": True,
+                    "post_id": post_id,
+                    "content": content,
+                    "news_title": news_title,
+                    "news_id": news_id,
+                    "response": response
+                }
+            
+            return failure("Failed to post after maximum retries")
+        
+        except Exception as e:
+            logger.warning("   ❌ Error posting content %d: %s", i, e)
+            return failure(str(e))
+    
+    def _post_retry_delay(self, error: Exception, retry_count: int) -> float:
+        """
+        Work out how long to wait before retrying a rate limited post.
+        
+        Honours the platform's Retry-After header (delay-seconds or an HTTP
+        date), then X-RateLimit-Reset (the Unix time the rate limit window
+        resets); the server's wait is never shortened, so the retry isn't
+        wasted. Otherwise backs off exponentially (10s, 20s, ...) up to
+        MAX_POST_RETRY_DELAY. Up to a second of jitter is added so concurrent
+        posts don't retry in lockstep.
+        
+        Args:
+            error (Exception): The rate limit error raised while posting
+            retry_count (int): Zero-based retry attempt number
+            
+        Returns:
+            float: Seconds to wait
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        reset = headers.get("X-RateLimit-Reset")
+        delay = None
+        
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+        
+        if delay is None and reset:
+            try:
+                delay = float(reset) - time.time()
+            except ValueError:
+                delay = None
+        
+        if delay is None:
+            delay = min(10 * (2 ** retry_count), MAX_POST_RETRY_DELAY)
+        
+        return max(delay, 0.0) + random.random()
+    
+    async def run_complete_workflow(self, trending_limit: int = 5, 
+                                    save_data: bool = True, max_posts: int = None) -> Dict[str, Any]:
         """
         Execute the complete automated content generation and posting workflow.
         
+        Steps 1 and 2 don't depend on each other and run concurrently.
+        
         Args:
             trending_limit (int): Number of trending posts to fetch (default: 5)
             save_data (bool): Whether to save intermediate data to files (default: True)
@@ -628,8 +864,8 @@ class PostOrchestrator:
         Returns:
             Dict[str, Any]: Complete workflow results and metadata
         """
-        print("🚀 Starting Complete Automated Content Workflow")
-        print("=" * 60)
+        logger.info("🚀 Starting Complete Automated Content Workflow")
+        logger.info("=" * 60)
         
         workflow_start = datetime.now()
         results = {
@@ -641,18 +877,19 @@ class PostOrchestrator:
         }
         
         try:
-            # Step 1: Get news and press releases
-            print("\n🎬 Executing automated content generation workflow...")
-            news_data = self.get_news_and_press_data()
+            # Step 1 and 2: Get news and press releases and trending social
+            # media posts at the same time
+            logger.info("\n🎬 Executing automated content generation workflow...")
+            news_data, trending_data = await asyncio.gather(
+                self.get_news_and_press_data_async(),
+                self.get_trending_social_data_async(limit=trending_limit)
+            )
             results["steps"]["news_data"] = {
                 "success": bool(news_data.get('main')),
                 "articles_count": len(news_data.get('main', [])),
                 "timestamp": datetime.now().isoformat()
             }
             
-            
-            # Step 2: Get trending social media posts
-            trending_data = self.get_trending_social_data(limit=trending_limit)           
             results["steps"]["trending_data"] = {
                 "success": bool(trending_data.get('data')),
                 "posts_count": len(trending_data.get('data', [])),
@@ -661,7 +898,7 @@ class PostOrchestrator:
             
             
             # Step 3: Generate social media content (now returns a list)
-            generated_posts = self.generate_social_content(news_data, trending_data)
+            generated_posts = await self.generate_social_content(news_data, trending_data)
             results["steps"]["content_generation"] = {
                 "success": bool(generated_posts and any(post.get('success') for post in generated_posts)),
                 "posts_generated": len(generated_posts) if generated_posts else 0,
@@ -675,9 +912,9 @@ class PostOrchestrator:
             posts_to_publish = generated_posts
             if max_posts and len(generated_posts) > max_posts:
                 posts_to_publish = generated_posts[:max_posts]
-                print(f"📌 Limiting posts to {max_posts} out of {len(generated_posts)} generated posts")
+                logger.info("📌 Limiting posts to %d out of %d generated posts", max_posts, len(generated_posts))
             
-            posting_results = self.post_social_content(posts_to_publish)
+            posting_results = await self.post_social_content(posts_to_publish)
             results["steps"]["posting"] = {
                 "success": bool(posting_results and any(post.get('success') for post in posting_results)),
                 "posts_attempted": len(posting_results) if posting_results else 0,
@@ -697,47 +934,41 @@ class PostOrchestrator:
             results["duration_seconds"] = (datetime.now() - workflow_start).total_seconds()
             
             # Final status report
-            print(f"\n🎯 Workflow Complete!")
-            print("=" * 30)
-            print(f"✅ Overall Success: {results['success']}")
-            print(f"⏱️  Duration: {results['duration_seconds']:.1f} seconds")
-            print(f"📊 Steps Results:")
+            logger.info("\n🎯 Workflow Complete!")
+            logger.info("=" * 30)
+            logger.info("✅ Overall Success: %s", results['success'])
+            logger.info("⏱️  Duration: %.1f seconds", results['duration_seconds'])
+            logger.info("📊 Steps Results:")
             for step_name, step_result in results["steps"].items():
                 status = "✅" if step_result.get('success') else "❌"
-                print(f"   {status} {step_name.replace('_', ' ').title()}")
+                logger.info("   %s %s", status, step_name.replace('_', ' ').title())
             
             if results["success"]:
                 successful_posts = results["steps"]["posting"]["successful_posts"]
                 total_posts = results["steps"]["posting"]["posts_attempted"]
-                print(f"\n🎉 Workflow completed successfully!")
-                print(f"📊 Summary: {successful_posts}/{total_posts} posts published")
+                logger.info("\n🎉 Workflow completed successfully!")
+                logger.info("📊 Summary: %d/%d posts published", successful_posts, total_posts)
                 
                 # Show sample of posted content
-                if posting_results and successful_posts > 0:
-                    print(f"📱 Sample posted content:")
+                if posting_results and successful_posts > 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📱 Sample posted content:")
                     for i, post in enumerate(posting_results[:3], 1):
                         if post.get('success'):
                             content = post.get('content', '')[:100] + "..." if len(post.get('content', '')) > 100 else post.get('content', '')
-                            print(f"   {i}. \"{content}\" (Post ID: {post.get('post_id')})")
+                            logger.debug("   %d. \"%s\" (Post ID: %s)", i, content, post.get('post_id'))
             else:
-                print(f"\n⚠️  Some steps failed. Check individual step results.")
+                logger.warning("\n⚠️  Some steps failed. Check individual step results.")
             
             return results
             
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Fatal workflow error: {error_msg}")
+            logger.error("❌ Fatal workflow error: %s", error_msg)
             results["errors"].append(error_msg)
             results["success"] = False
             results["end_time"] = datetime.now().isoformat()
             results["duration_seconds"] = (datetime.now() - workflow_start).total_seconds()
             return results
-        
-        finally:
-            # Cleanup: Stop social bot if it was started
-            if self.social_bot and self.social_bot.running:
-                self.social_bot.stop()
-                print("🛑 Social bot stopped")
     
     def test_all_components(self) -> Dict[str, bool]:
         """
@@ -795,6 +1026,44 @@ class PostOrchestrator:
         return test_results
 
 
+async def _workflow_loop(orchestrator: PostOrchestrator, args) -> None:
+    """
+    Run the complete workflow endlessly, with random delays between runs.
+    
+    Every run shares this one event loop, so the async Azure OpenAI clients
+    bound to it (and their keep-alive connections) are reused across runs
+    instead of being rebuilt by a fresh asyncio.run() each time.
+    
+    Args:
+        orchestrator (PostOrchestrator): Orchestrator to run the workflow with
+        args (argparse.Namespace): Parsed command-line arguments
+    """
+    runcount = 0
+    # Run in endless loop with random delays
+    while True:
+        runcount += 1
+        try:
+            await orchestrator.run_complete_workflow(
+                trending_limit=args.trending_limit,
+                save_data=not args.no_save,
+                max_posts=args.max_posts
+            )
+            
+            # Random delay between 5 and 30 seconds
+            delay = random.randint(5, 30)
+            print(f"\n⏰ Waiting {delay} seconds before next workflow run...")
+            print ("*****************************")
+            print (f"Completed run **{runcount}**")
+            print ("*****************************")
+            await asyncio.sleep(delay)
+        except Exception as e:
+            print(f"❌ Error in workflow loop: {e}")
+            # Wait before retrying on error
+            delay = random.randint(10, 20)
+            print(f"⏰ Waiting {delay} seconds before retry...")
+            await asyncio.sleep(delay)
+
+
 def main():
     """
     Main execution function with command-line interface.
@@ -836,6 +1105,8 @@ Examples:
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+    
     try:
         # Initialize orchestrator
         orchestrator = PostOrchestrator(args.config)
@@ -859,7 +1130,7 @@ Examples:
         if args.generate_only:
             news_data = orchestrator.get_news_and_press_data()
             trending_data = orchestrator.get_trending_social_data(limit=args.trending_limit)
-            generated_posts = orchestrator.generate_social_content(news_data, trending_data)
+            generated_posts = asyncio.run(orchestrator.generate_social_content(news_data, trending_data))
             
             print(f"\n🤖 Generated {len(generated_posts)} social media posts:")
             for i, post in enumerate(generated_posts, 1):
@@ -870,33 +1141,11 @@ Examples:
         
         # Default: Run complete workflow
         if args.run_workflow or len(sys.argv) == 1:
-            runcount = 0
-            # Run in endless loop with random delays
-            while True:
-                runcount += 1
-                try:
-                    results = orchestrator.run_complete_workflow(
-                        trending_limit=args.trending_limit,
-                        save_data=not args.no_save,
-                        max_posts=args.max_posts
-                    )
-                    
-                    # Random delay between 5 and 30 seconds
-                    delay = random.randint(5, 30)
-                    print(f"\n⏰ Waiting {delay} seconds before next workflow run...")
-                    print ("*****************************")
-                    print (f"Completed run **{runcount}**")
-                    print ("*****************************")
-                    time.sleep(delay)
-                except KeyboardInterrupt:
-                    print("\n👋 Workflow loop interrupted by user")
-                    break
-                except Exception as e:
-                    print(f"❌ Error in workflow loop: {e}")
-                    # Wait before retrying on error
-                    delay = random.randint(10, 20)
-                    print(f"⏰ Waiting {delay} seconds before retry...")
-                    time.sleep(delay)
+            try:
+                asyncio.run(_workflow_loop(orchestrator, args))
+            except KeyboardInterrupt:
+                print("\n👋 Workflow loop interrupted by user")
+            orchestrator.close()
             # return 0 if results.get('success') else 1
         
         # If no specific command, show help
@@ -16,6 +16,7 @@ Key Features:
 
 import requests
 import json
+import time
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 
@@ -66,6 +67,8 @@ class PostingManager:
                 
         Raises:
             Exception: If not authenticated or if post creation fails
+            requests.HTTPError: If the API rejects the post; the response
+                                (status code, Retry-After header) is attached
             
         Example:
             # Simple text post
@@ -107,23 +110,23 @@ class PostingManager:
                 json=payload,
                 headers=self.auth_manager.get_auth_headers()
             )
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                post_id = result.get('data', {}).get('id', 'Unknown')
-                print(f"✅ Post created successfully with ID: {post_id}")
-                return result
-            else:
-                error_msg = f"Post creation failed: {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    error_msg += f" - {error_detail}"
-                except:
-                    error_msg += f" - {response.text}"
-                raise Exception(error_msg)
-                
         except requests.RequestException as e:
             raise Exception(f"Network error during post creation: {e}")
+        
+        if response.status_code in [200, 201]:
+            result = response.json()
+            post_id = result.get('data', {}).get('id', 'Unknown')
+            print(f"✅ Post created successfully with ID: {post_id}")
+            return result
+        
+        error_msg = f"Post creation failed: {response.status_code}"
+        try:
+            error_detail = response.json()
+            error_msg += f" - {error_detail}"
+        except:
+            error_msg += f" - {response.text}"
+        # Keep the response so callers can honour rate limit headers
+        raise requests.HTTPError(error_msg, response=response)
     
     def get_post(self, post_id: int) -> Dict[str, Any]:
         """
@@ -382,10 +385,14 @@ class PostingManager:
         
         This method creates multiple posts where each post (except the first)
         is a reply to the previous one, forming a threaded conversation.
+        Because every post needs its parent's ID the posts are created in
+        order, but the request time counts towards the delay, so the bot only
+        sleeps for whatever part of delay_seconds the request didn't use.
         
         Args:
             posts (List[str]): List of post contents to create as a thread
-            delay_seconds (float): Delay between posts to avoid rate limiting
+            delay_seconds (float): Minimum interval between the start of
+                                   consecutive posts to avoid rate limiting
             
         Returns:
             List[Dict[str, Any]]: List of responses for each created post
@@ -406,16 +413,18 @@ class PostingManager:
                 if i > 0:
                     content = f"{content} ({i+1}/{len(posts)})"
                 
+                started = time.monotonic()
                 result = self.create_post(content, parent_id=parent_id)
                 results.append(result)
                 
                 # Set parent for next post
                 parent_id = result.get('data', {}).get('id')
                 
-                # Delay between posts to avoid rate limiting
+                # Wait out the rest of the interval to avoid rate limiting
                 if i < len(posts) - 1 and delay_seconds > 0:
-                    import time
-                    time.sleep(delay_seconds)
+                    remaining = delay_seconds - (time.monotonic() - started)
+                    if remaining > 0:
+                        time.sleep(remaining)
                     
             except Exception as e:
                 print(f"❌ Thread creation failed at post {i+1}: {e}")
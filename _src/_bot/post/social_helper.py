@@ -26,18 +26,25 @@ Usage Examples:
 """
 
 import argparse
+import logging
 import sys
 import time
 import signal
 import threading
+from collections import deque
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+import requests
+
 # Import our custom modules
 from auth_manager import AuthenticationManager
 from posting_manager import PostingManager
 from config_manager import ConfigurationManager
 
+# Most recently engaged post ids remembered by auto_engage to skip repeats
+MAX_ENGAGED_POST_IDS = 1000
+
 
 class TwooterTeamBot:
     """
@@ -62,6 +69,9 @@ class TwooterTeamBot:
         self.running = False
         self.auto_mode = False
         
+        # Set by stop() so waits in the monitoring loops end immediately
+        self._stop_event = threading.Event()
+        
         print("🤖 Twooter Team Bot initialized")
         
         # Validate configuration
@@ -124,6 +134,7 @@ class TwooterTeamBot:
             self.posting_manager = PostingManager(self.auth_manager)
             
             self.running = True
+            self._stop_event.clear()
             print("✅ Bot started successfully!")
             print(f"👤 Logged in as: {self.auth_manager.get_current_user()}")
             
@@ -139,6 +150,7 @@ class TwooterTeamBot:
         
         self.running = False
         self.auto_mode = False
+        self._stop_event.set()
         
         # Note: We don't logout here to preserve the token for next run
         # Use --logout flag or logout command to explicitly clear tokens
@@ -336,6 +348,10 @@ class TwooterTeamBot:
             
         Returns:
             Optional[Dict[str, Any]]: Created post data or None if failed
+            
+        Raises:
+            requests.HTTPError: If the platform rate limits the post (429), so
+                                callers can back off and retry
         """
         if not self.posting_manager:
             print("❌ Bot not started. Call start() first.")
@@ -354,6 +370,11 @@ class TwooterTeamBot:
             else:
                 print(f"❌ Failed to create post: {result}")
                 return None
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 429:
+                raise
+            print(f"❌ Failed to create post: {e}")
+            return None
         except Exception as e:
             print(f"❌ Failed to create post: {e}")
             return None
@@ -440,7 +461,7 @@ class TwooterTeamBot:
                 
                 # Wait before next check
                 print(f"\n💤 Waiting {interval}s before next check...")
-                time.sleep(interval)
+                self._stop_event.wait(interval)
                 
         except KeyboardInterrupt:
             print("\n⏹️  Feed monitoring stopped by user")
@@ -456,6 +477,9 @@ class TwooterTeamBot:
         
         This method starts an automated process that monitors for posts
         containing specified keywords and performs automated actions.
+        Calling stop() from another thread (for example via
+        ``threading.Timer(120, bot.stop).start()``) ends the loop immediately
+        instead of after the current wait.
         
         Args:
             keywords (List[str]): Keywords to monitor for
@@ -470,6 +494,14 @@ class TwooterTeamBot:
         if actions is None:
             actions = ['like']
         
+        # Keyword matching is done server-side by search_posts, so the only
+        # local work is avoiding duplicate searches and duplicate actions
+        keywords = list(dict.fromkeys(k.strip() for k in keywords if k.strip()))
+        # Bounded memory of engaged posts: the set answers lookups, the deque
+        # evicts the oldest id once MAX_ENGAGED_POST_IDS is reached
+        engaged_post_ids = set()
+        engaged_order = deque()
+        
         self.auto_mode = True
         action_count = 0
         last_reset = time.time()
@@ -493,45 +525,60 @@ class TwooterTeamBot:
                 # Check if we've hit rate limit
                 if action_count >= max_actions_per_hour:
                     print(f"⏸️  Rate limit reached ({max_actions_per_hour}/hour). Waiting...")
-                    time.sleep(check_interval)
+                    self._stop_event.wait(check_interval)
                     continue
                 
                 # Search for posts with keywords
                 for keyword in keywords:
+                    if self._stop_event.is_set():
+                        return
                     try:
                         results = self.posting_manager.search_posts(keyword, limit=5)
                         posts = results.get('data', [])
                         
                         for post in posts[:2]:  # Limit to 2 posts per keyword per check
                             post_id = post.get('id')
-                            if not post_id:
+                            if not post_id or post_id in engaged_post_ids:
                                 continue
                             
                             # Perform actions
+                            engaged = False
                             for action in actions:
                                 if action_count >= max_actions_per_hour:
                                     break
                                 
+                                result = None
                                 if action == 'like':
-                                    self.like_post(post_id)
+                                    result = self.like_post(post_id)
                                     action_count += 1
                                 elif action == 'repost':
-                                    self.repost(post_id)
+                                    result = self.repost(post_id)
                                     action_count += 1
                                 elif action == 'reply':
                                     reply_text = f"Thanks for sharing about {keyword}! 🤖"
-                                    self.post(reply_text, parent_id=post_id)
+                                    result = self.post(reply_text, parent_id=post_id)
                                     action_count += 1
                                 
-                                # Small delay between actions
-                                time.sleep(2)
+                                # Only remember the post once something on it
+                                # worked, so failed actions are retried later
+                                if result and not engaged:
+                                    engaged = True
+                                    engaged_post_ids.add(post_id)
+                                    engaged_order.append(post_id)
+                                    if len(engaged_order) > MAX_ENGAGED_POST_IDS:
+                                        engaged_post_ids.discard(engaged_order.popleft())
+                                
+                                # Small delay between actions; stop() ends the
+                                # whole run, not just this post's actions
+                                if self._stop_event.wait(2):
+                                    return
                         
                     except Exception as e:
                         print(f"⚠️  Error processing keyword '{keyword}': {e}")
                 
                 # Wait before next check
                 print(f"💤 Waiting {check_interval}s before next check... (Actions: {action_count}/{max_actions_per_hour})")
-                time.sleep(check_interval)
+                self._stop_event.wait(check_interval)
                 
         except KeyboardInterrupt:
             print("\n⏹️  Auto-engagement stopped by user")
@@ -937,6 +984,11 @@ Examples:
     
     args = parser.parse_args()
     
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s"
+    )
+    
     # Handle configuration commands first
     if args.create_config:
         config = ConfigurationManager()
@@ -10,6 +10,7 @@ from victor_posts_extractor import VictorPostsExtractor
 from azure_openai_client import VictorCampaignAzureOpenAI
 from auth_manager import AuthenticationManager
 from posting_manager import PostingManager
+import logging
 import time
 import random
 
@@ -371,5 +372,7 @@ def run_continuous_monitoring():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Run continuous monitoring
     run_continuous_monitoring()
\ No newline at end of file
@@ -16,6 +16,7 @@ Key Features:
 
 import requests
 import json
+import time
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 
@@ -382,10 +383,14 @@ class PostingManager:
         
         This method creates multiple posts where each post (except the first)
         is a reply to the previous one, forming a threaded conversation.
+        Because every post needs its parent's ID the posts are created in
+        order, but the request time counts towards the delay, so the bot only
+        sleeps for whatever part of delay_seconds the request didn't use.
         
         Args:
             posts (List[str]): List of post contents to create as a thread
-            delay_seconds (float): Delay between posts to avoid rate limiting
+            delay_seconds (float): Minimum interval between the start of
+                                   consecutive posts to avoid rate limiting
             
         Returns:
             List[Dict[str, Any]]: List of responses for each created post
@@ -406,16 +411,18 @@ class PostingManager:
                 if i > 0:
                     content = f"{content} ({i+1}/{len(posts)})"
                 
+                started = time.monotonic()
                 result = self.create_post(content, parent_id=parent_id)
                 results.append(result)
                 
                 # Set parent for next post
                 parent_id = result.get('data', {}).get('id')
                 
-                # Delay between posts to avoid rate limiting
+                # Wait out the rest of the interval to avoid rate limiting
                 if i < len(posts) - 1 and delay_seconds > 0:
-                    import time
-                    time.sleep(delay_seconds)
+                    remaining = delay_seconds - (time.monotonic() - started)
+                    if remaining > 0:
+                        time.sleep(remaining)
                     
             except Exception as e:
                 print(f"❌ Thread creation failed at post {i+1}: {e}")
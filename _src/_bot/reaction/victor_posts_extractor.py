@@ -11,6 +11,7 @@ Usage:
 """
 
 import json
+import logging
 from typing import Dict, List, Any
 from auth_manager import AuthenticationManager
 from config_manager import ConfigurationManager
@@ -157,6 +158,8 @@ def main():
     """
     Main function to extract Victor Hawthorne posts.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     extractor = VictorPostsExtractor()
     
     # Login
@@ -11,6 +11,7 @@ from trending_extractor import TrendingHashtagExtractor
 from azure_openai_client import VictorCampaignTrendingAI
 from auth_manager import AuthenticationManager
 from posting_manager import PostingManager
+import logging
 import time
 import random
 
@@ -308,5 +309,7 @@ def run_continuous_trending_monitoring():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Run continuous trending content monitoring
     run_continuous_trending_monitoring()
\ No newline at end of file